@@ -9,6 +9,13 @@ import os
 import sys
 from typing import Dict, Any, List, Optional
 
+from zotero_mcp.utils import TTLCache
+
+# Successful "is Zotero running" probes by port, and item.search results by
+# (port, query). Both are short-lived since Zotero can be closed at any time.
+_probe_cache = TTLCache(maxsize=4, ttl=30)
+_search_cache = TTLCache(maxsize=256, ttl=30)
+
 class ZoteroBetterBibTexAPI:
     """Class to interact with Zotero's local Better BibTeX JSON-RPC API"""
 
@@ -73,16 +80,37 @@ class ZoteroBetterBibTexAPI:
             raise Exception(f"Connection error: {str(e)}. Is Zotero running with Better BibTeX installed?")
 
     def is_zotero_running(self) -> bool:
-        """Check if Zotero is running and accessible."""
+        """Check if Zotero is running and accessible (a positive result is cached for 30 seconds)."""
+        if _probe_cache.get(self.port):
+            return True
         try:
             response = requests.get(
                 f"http://127.0.0.1:{self.port}/better-bibtex/cayw?probe=true",
                 headers=self.headers,
                 timeout=5
             )
-            return response.text == "ready"
+            running = response.text == "ready"
         except:
             return False
+        if running:
+            _probe_cache.set(self.port, True)
+        return running
+
+    def search_items(self, query: str) -> list[dict[str, Any]]:
+        """
+        Run Better BibTeX's item.search, reusing results from the last 30 seconds.
+
+        Args:
+            query: Search term or citation key
+
+        Returns:
+            The matching items
+        """
+        results = _search_cache.get((self.port, query))
+        if results is None:
+            results = self._make_request("item.search", [query])
+            _search_cache.set((self.port, query), results)
+        return results
 
     def get_item_by_citekey(self, citekey: str) -> dict[str, Any]:
         """
@@ -95,7 +123,7 @@ class ZoteroBetterBibTexAPI:
             The item data
         """
         # First, search for the item to get its ID and library ID
-        search_results = self._make_request("item.search", [citekey])
+        search_results = self.search_items(citekey)
 
         if not search_results:
             raise Exception(f"No items found with citekey: {citekey}")
@@ -185,7 +213,7 @@ class ZoteroBetterBibTexAPI:
         """
         try:
             # Use the general item.search method with the query
-            search_results = self._make_request("item.search", [query])
+            search_results = self.search_items(query)
 
             # If no results found, return empty list
             if not search_results:
@@ -19,6 +19,15 @@ from chromadb.config import Settings
 
 logger = logging.getLogger(__name__)
 
+# HNSW index parameters for new collections. Chroma's defaults (M=16,
+# construction_ef=100, search_ef=10) trade recall for build speed; a wider
+# graph and search beam keep recall high on large libraries.
+DEFAULT_HNSW_CONFIG = {
+    "M": 32,
+    "construction_ef": 200,
+    "search_ef": 100,
+}
+
 
 @contextmanager
 def suppress_stdout():
@@ -136,7 +145,8 @@ class ChromaClient:
                  collection_name: str = "zotero_library",
                  persist_directory: str | None = None,
                  embedding_model: str = "default",
-                 embedding_config: dict[str, Any] | None = None):
+                 embedding_config: dict[str, Any] | None = None,
+                 hnsw_config: dict[str, int] | None = None):
         """
         Initialize ChromaDB client.
 
@@ -145,10 +155,13 @@ class ChromaClient:
             persist_directory: Directory to persist the database
             embedding_model: Model to use for embeddings ('default', 'openai', 'gemini', 'mistral', 'qwen', 'embeddinggemma', or HuggingFace model name)
             embedding_config: Configuration for the embedding model
+            hnsw_config: HNSW index parameters (M, construction_ef, search_ef);
+                applied when a collection is created or reset
         """
         self.collection_name = collection_name
         self.embedding_model = embedding_model
         self.embedding_config = embedding_config or {}
+        self.hnsw_config = {**DEFAULT_HNSW_CONFIG, **(hnsw_config or {})}
 
         # Set up persistent directory
         if persist_directory is None:
@@ -208,13 +221,20 @@ class ChromaClient:
                 self.collection = self.client.create_collection(
                     name=self.collection_name,
                     embedding_function=self.embedding_function,
-                    metadata={
-                        "embedding_function": getattr(
-                            self.embedding_function, "name", lambda: "default"
-                        )()
-                    }
+                    metadata=self._collection_metadata()
                 )
 
+    def _collection_metadata(self) -> dict[str, Any]:
+        """Build metadata for a new collection: embedding function name and HNSW parameters."""
+        metadata = {
+            "embedding_function": getattr(
+                self.embedding_function, "name", lambda: "default"
+            )()
+        }
+        for key, value in self.hnsw_config.items():
+            metadata[f"hnsw:{key}"] = int(value)
+        return metadata
+
     def _create_embedding_function(self) -> EmbeddingFunction:
         """Create the appropriate embedding function based on configuration."""
         if self.embedding_model == "openai":
@@ -309,11 +329,24 @@ class ChromaClient:
             logger.error(f"Error upserting documents to ChromaDB: {e}")
             raise
 
+    def embed_query(self, text: str) -> list[float]:
+        """
+        Embed a single query text with the collection's embedding function.
+
+        Args:
+            text: Query text
+
+        Returns:
+            The query embedding
+        """
+        return list(self.embedding_function([text])[0])
+
     def search(self,
-               query_texts: list[str],
+               query_texts: list[str] | None = None,
                n_results: int = 10,
                where: dict[str, Any] | None = None,
-               where_document: dict[str, Any] | None = None) -> dict[str, Any]:
+               where_document: dict[str, Any] | None = None,
+               query_embeddings: list[list[float]] | None = None) -> dict[str, Any]:
         """
         Search for similar documents.
 
@@ -322,13 +355,18 @@ class ChromaClient:
             n_results: Number of results to return
             where: Metadata filter conditions
             where_document: Document content filter conditions
+            query_embeddings: Precomputed query embeddings, used instead of query_texts
 
         Returns:
             Search results from ChromaDB
         """
         try:
+            if query_embeddings is not None:
+                query_args = {"query_embeddings": query_embeddings}
+            else:
+                query_args = {"query_texts": query_texts}
             results = self.collection.query(
-                query_texts=query_texts,
+                **query_args,
                 n_results=n_results,
                 where=where,
                 where_document=where_document
@@ -380,11 +418,7 @@ class ChromaClient:
             self.collection = self.client.create_collection(
                 name=self.collection_name,
                 embedding_function=self.embedding_function,
-                metadata={
-                    "embedding_function": getattr(
-                        self.embedding_function, "name", lambda: "default"
-                    )()
-                }
+                metadata=self._collection_metadata()
             )
             logger.info(f"Reset ChromaDB collection '{self.collection_name}'")
         except Exception as e:
@@ -432,7 +466,8 @@ def create_chroma_client(config_path: str | None = None) -> ChromaClient:
     config = {
         "collection_name": "zotero_library",
         "embedding_model": "default",
-        "embedding_config": {}
+        "embedding_config": {},
+        "hnsw_config": {}
     }
 
     # Load configuration from file if it exists
@@ -490,5 +525,6 @@ def create_chroma_client(config_path: str | None = None) -> ChromaClient:
     return ChromaClient(
         collection_name=config["collection_name"],
         embedding_model=config["embedding_model"],
-        embedding_config=config["embedding_config"]
+        embedding_config=config["embedding_config"],
+        hnsw_config=config["hnsw_config"]
     )
@@ -11,6 +11,7 @@ import sys
 from pathlib import Path
 
 from zotero_mcp.server import mcp
+from zotero_mcp.utils import is_local_mode
 
 
 def obfuscate_sensitive_value(value, keep_chars=4):
@@ -82,6 +83,8 @@ def apply_environment_variables(env_vars):
     for key, value in env_vars.items():
         if key not in os.environ:  # Don't override existing env vars
             os.environ[key] = str(value)
+            if key == "ZOTERO_LOCAL":
+                is_local_mode.cache_clear()
 
 
 def _save_zotero_db_path_to_config(config_path: Path, db_path: str) -> None:
@@ -3,15 +3,21 @@ Zotero client wrapper for MCP server.
 """
 
 import os
+import threading
+import time
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
+from urllib.parse import urljoin
 
+import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from markitdown import MarkItDown
 from pyzotero import zotero
 
-from zotero_mcp.utils import format_creators
+from zotero_mcp.utils import extract_citation_key, format_creators
 
 # Load environment variables
 load_dotenv()
@@ -27,20 +33,35 @@ class AttachmentDetails:
     content_type: str
 
 
+_client_cache = threading.local()
+
+
 def get_zotero_client() -> zotero.Zotero:
     """
     Get authenticated Zotero client using environment variables.
 
+    Clients are cached per thread so repeated calls reuse the same HTTP
+    connection. pyzotero clients keep request state, so one is never shared
+    between threads. A new client is created when the settings change.
+
     Returns:
         A configured Zotero client instance.
 
     Raises:
         ValueError: If required environment variables are missing.
     """
-    library_id = os.getenv("ZOTERO_LIBRARY_ID")
-    library_type = os.getenv("ZOTERO_LIBRARY_TYPE", "user")
-    api_key = os.getenv("ZOTERO_API_KEY")
-    local = os.getenv("ZOTERO_LOCAL", "").lower() in ["true", "yes", "1"]
+    settings = (
+        os.getenv("ZOTERO_LIBRARY_ID"),
+        os.getenv("ZOTERO_LIBRARY_TYPE", "user"),
+        os.getenv("ZOTERO_API_KEY"),
+        os.getenv("ZOTERO_LOCAL", ""),
+    )
+    cached = getattr(_client_cache, "entry", None)
+    if cached is not None and cached[0] == settings:
+        return cached[1]
+
+    library_id, library_type, api_key, local_value = settings
+    local = local_value.lower() in ["true", "yes", "1"]
 
     # For local API, default to user ID 0 if not specified
     if local and not library_id:
@@ -53,12 +74,14 @@ def get_zotero_client() -> zotero.Zotero:
             "or use ZOTERO_LOCAL=true for local Zotero instance."
         )
 
-    return zotero.Zotero(
+    client = zotero.Zotero(
         library_id=library_id,
         library_type=library_type,
         api_key=api_key,
         local=local,
     )
+    _client_cache.entry = (settings, client)
+    return client
 
 
 def format_item_metadata(item: dict[str, Any], include_abstract: bool = True) -> str:
@@ -119,11 +142,8 @@ def format_item_metadata(item: dict[str, Any], include_abstract: bool = True) ->
         lines.extend(["", "## Extra", extra])
 
         # Try to surface a citation key if present in Extra
-        for line in extra.splitlines():
-            if "citation key" in line.lower():
-                key_part = line.split(":", 1)[1].strip() if ":" in line else line.strip()
-                lines.append(f"**Citation Key (from Extra):** {key_part}")
-                break
+        if citation_key := extract_citation_key(extra):
+            lines.append(f"**Citation Key (from Extra):** {citation_key}")
     
     # Tags
     if tags := data.get("tags"):
@@ -320,6 +340,74 @@ def get_attachment_details(
     return None
 
 
+_DOWNLOAD_CHUNK_SIZE = 1 << 16
+# Longest Retry-After wait honoured before retrying a file download
+_MAX_RETRY_AFTER_SECONDS = 30.0
+
+
+@lru_cache(maxsize=1)
+def _http_session() -> requests.Session:
+    """
+    Get the shared HTTP session for direct Zotero web API requests.
+
+    The session keeps connections alive between requests, with a pool large
+    enough for the worker threads that download attachments concurrently.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def download_attachment(zot: zotero.Zotero, attachment_key: str, file_path: str | Path) -> None:
+    """
+    Download an attachment file to disk.
+
+    With the web API the file is streamed to disk in chunks instead of being
+    read into memory first. The local API is left to pyzotero's ``dump``.
+
+    Args:
+        zot: A Zotero client instance.
+        attachment_key: Key of the attachment item.
+        file_path: Where to write the file.
+
+    Raises:
+        requests.HTTPError: If the web API returns an error status.
+    """
+    if getattr(zot, "local", False) or not getattr(zot, "api_key", None):
+        file_path = Path(file_path)
+        zot.dump(attachment_key, filename=file_path.name, path=str(file_path.parent))
+        return
+
+    session = _http_session()
+    url = f"{zot.endpoint}/{zot.library_type}/{zot.library_id}/items/{attachment_key}/file"
+    headers = {"Zotero-API-Key": zot.api_key}
+
+    # The API answers with a redirect to the file storage host. Follow it by
+    # hand so the API key is only ever sent to the Zotero API itself.
+    response = session.get(url, headers=headers, allow_redirects=False, stream=True, timeout=60)
+    if response.status_code in (429, 503) and "Retry-After" in response.headers:
+        # Rate limited: wait as the API asks (seconds form only) and retry once
+        try:
+            delay = min(float(response.headers["Retry-After"]), _MAX_RETRY_AFTER_SECONDS)
+        except ValueError:
+            delay = 1.0
+        response.close()
+        time.sleep(delay)
+        response = session.get(url, headers=headers, allow_redirects=False, stream=True, timeout=60)
+    if response.is_redirect:
+        location = urljoin(url, response.headers["Location"])
+        response.close()
+        response = session.get(location, stream=True, timeout=60)
+
+    with response:
+        response.raise_for_status()
+        with open(file_path, "wb") as f:
+            for chunk in response.iter_content(_DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+
+
 def convert_to_markdown(file_path: str | Path) -> str:
     """
     Convert a file to markdown using markitdown library.
@@ -336,3 +424,39 @@ def convert_to_markdown(file_path: str | Path) -> str:
         return result.text_content
     except Exception as e:
         return f"Error converting file to markdown: {str(e)}"
+
+
+def convert_to_markdown_stream(file_path: str | Path) -> Iterator[str]:
+    """
+    Convert a file to markdown, yielding the text in pieces.
+
+    PDFs are extracted page by page with pdfminer (the same extractor markitdown
+    uses), so the whole document never has to be held as a single string.
+    Other formats are converted in one piece with markitdown.
+
+    Args:
+        file_path: Path to the file to convert.
+
+    Yields:
+        Markdown text, one page at a time for PDFs.
+    """
+    if str(file_path).lower().endswith(".pdf"):
+        try:
+            from pdfminer.high_level import extract_pages
+            from pdfminer.layout import LTTextContainer
+        except ImportError:
+            pass
+        else:
+            try:
+                for page_number, page in enumerate(extract_pages(str(file_path))):
+                    text = "".join(
+                        element.get_text()
+                        for element in page
+                        if isinstance(element, LTTextContainer)
+                    )
+                    yield ("\n\n" if page_number else "") + text
+            except Exception as e:
+                yield f"Error converting file to markdown: {str(e)}"
+            return
+
+    yield convert_to_markdown(file_path)
@@ -6,20 +6,24 @@ with the existing Zotero client to enable vector-based similarity search
 over research libraries.
 """
 
+import copy
 import json
 import os
 import sys
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 import logging
 
+import numpy as np
 from pyzotero import zotero
 
 from .chroma_client import ChromaClient, create_chroma_client
 from .client import get_zotero_client
-from .utils import format_creators, is_local_mode
+from .utils import extract_citation_key, format_creators, is_local_mode
 from .local_db import LocalZoteroReader, get_local_zotero_reader
 
 logger = logging.getLogger(__name__)
@@ -37,6 +41,84 @@ def suppress_stdout():
             sys.stdout = old_stdout
 
 
+class QueryEmbeddingCache:
+    """
+    Reuse results for queries whose embeddings are nearly identical.
+
+    Keeps a FIFO ring of recent (embedding, results) pairs and answers a new
+    query from the most similar entry when cosine similarity reaches the
+    threshold, so paraphrased queries skip the vector search entirely.
+    Entries expire after ``ttl`` seconds, since the index can be rebuilt by
+    another process (``zotero-mcp update-db``) without clearing this cache.
+    """
+
+    def __init__(self, max_entries: int = 256, threshold: float = 0.97, ttl: float = 60.0):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ttl = ttl
+        self._entries: list[tuple[np.ndarray, str, dict[str, Any], float]] = []
+        self._matrix: np.ndarray | None = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(embedding: Any) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def get(self, embedding: Any, key: str) -> dict[str, Any] | None:
+        """
+        Look up cached results for a query embedding.
+
+        Args:
+            embedding: Query embedding
+            key: Search parameters the results depend on (limit and filters)
+
+        Returns:
+            A copy of the cached results, or None if no entry is similar enough
+        """
+        vector = self._normalize(embedding)
+        with self._lock:
+            # Entries share one TTL, so the expired ones are the oldest
+            now = time.monotonic()
+            expired = 0
+            while expired < len(self._entries) and self._entries[expired][3] <= now:
+                expired += 1
+            if expired:
+                del self._entries[:expired]
+                self._matrix = None
+            if not self._entries:
+                return None
+            if self._matrix is None:
+                self._matrix = np.stack([entry[0] for entry in self._entries])
+            if self._matrix.shape[1] != vector.shape[0]:
+                return None
+            similarities = self._matrix @ vector
+            # Best matches first; only entries with the same parameters qualify
+            for idx in np.argsort(similarities)[::-1]:
+                if similarities[idx] < self.threshold:
+                    break
+                if self._entries[idx][1] == key:
+                    return copy.deepcopy(self._entries[idx][2])
+        return None
+
+    def put(self, embedding: Any, key: str, results: dict[str, Any]) -> None:
+        """Store a copy of results for a query embedding, evicting the oldest entry when full."""
+        vector = self._normalize(embedding)
+        results = copy.deepcopy(results)
+        with self._lock:
+            self._entries.append((vector, key, results, time.monotonic() + self.ttl))
+            if len(self._entries) > self.max_entries:
+                del self._entries[0]
+            self._matrix = None
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._matrix = None
+
+
 class ZoteroSemanticSearch:
     """Semantic search interface for Zotero libraries using ChromaDB."""
 
@@ -53,13 +135,26 @@ class ZoteroSemanticSearch:
             db_path: Optional path to Zotero database (overrides config file)
         """
         self.chroma_client = chroma_client or create_chroma_client(config_path)
-        self.zotero_client = get_zotero_client()
         self.config_path = config_path
         self.db_path = db_path  # CLI override for Zotero database path
 
         # Load update configuration
         self.update_config = self._load_update_config()
 
+        # Results of recent queries, matched by embedding similarity
+        self.query_cache = QueryEmbeddingCache()
+
+    @property
+    def zotero_client(self) -> zotero.Zotero:
+        """
+        Zotero client for the calling thread.
+
+        One instance serves searches and database updates that may run in
+        different threads at once, and pyzotero clients keep per-request
+        state, so each thread gets its own client from get_zotero_client.
+        """
+        return get_zotero_client()
+
     def _load_update_config(self) -> dict[str, Any]:
         """Load update configuration from file or use defaults."""
         config = {
@@ -191,13 +286,7 @@ class ZoteroSemanticSearch:
             metadata["tags"] = ""
 
         # Add citation key if available
-        extra = data.get("extra", "")
-        citation_key = ""
-        for line in extra.split("\n"):
-            if line.lower().startswith(("citation key:", "citationkey:")):
-                citation_key = line.split(":", 1)[1].strip()
-                break
-        metadata["citation_key"] = citation_key
+        metadata["citation_key"] = extract_citation_key(data.get("extra", "")) or ""
 
         return metadata
 
@@ -651,6 +740,9 @@ class ZoteroSemanticSearch:
                 except Exception:
                     pass
 
+            # Cached query results no longer reflect the index
+            self.query_cache.clear()
+
             # Update last update time
             self.update_config["last_update"] = datetime.now().isoformat()
             self._save_update_config()
@@ -731,23 +823,33 @@ class ZoteroSemanticSearch:
             Search results with Zotero item details
         """
         try:
-            # Perform semantic search
+            # Embed the query once; the vector serves both the cache and the search
+            query_embedding = self.chroma_client.embed_query(query)
+            cache_key = json.dumps([limit, filters], sort_keys=True)
+            cached = self.query_cache.get(query_embedding, cache_key)
+            if cached is not None:
+                cached["query"] = query
+                return cached
+
+            # Perform semantic search, filtering inside the index
             results = self.chroma_client.search(
-                query_texts=[query],
+                query_embeddings=[query_embedding],
                 n_results=limit,
-                where=filters
+                where=self._build_where(filters)
             )
 
             # Enrich results with full Zotero item data
             enriched_results = self._enrich_search_results(results, query)
 
-            return {
+            response = {
                 "query": query,
                 "limit": limit,
                 "filters": filters,
                 "results": enriched_results,
                 "total_found": len(enriched_results)
             }
+            self.query_cache.put(query_embedding, cache_key, response)
+            return response
 
         except Exception as e:
             logger.error(f"Error performing semantic search: {e}")
@@ -760,6 +862,34 @@ class ZoteroSemanticSearch:
                 "error": str(e)
             }
 
+    @staticmethod
+    def _build_where(filters: dict[str, Any] | None) -> dict[str, Any] | None:
+        """
+        Translate simple metadata filters into a ChromaDB where clause.
+
+        ChromaDB accepts only one field per where dict, so several fields are
+        combined with $and. String booleans are converted because flags such as
+        has_fulltext are stored as real booleans.
+
+        Args:
+            filters: Field/value filters, or an existing where clause
+
+        Returns:
+            A where clause for ChromaDB, or None for no filtering
+        """
+        if not filters:
+            return None
+        if any(key.startswith("$") for key in filters):
+            return filters
+
+        def normalize(value: Any) -> Any:
+            if isinstance(value, str) and value.lower() in ("true", "false"):
+                return value.lower() == "true"
+            return value
+
+        clauses = [{key: normalize(value)} for key, value in filters.items()]
+        return clauses[0] if len(clauses) == 1 else {"$and": clauses}
+
     def _enrich_search_results(self, chroma_results: dict[str, Any], query: str) -> list[dict[str, Any]]:
         """Enrich ChromaDB results with full Zotero item data."""
         enriched = []
@@ -772,10 +902,22 @@ class ZoteroSemanticSearch:
         documents = chroma_results.get("documents", [[]])[0]
         metadatas = chroma_results.get("metadatas", [[]])[0]
 
+        # Fetch full item data in batches (the API accepts up to 50 keys per request)
+        items_by_key = {}
+        for start in range(0, len(ids), 50):
+            batch_keys = ids[start:start + 50]
+            try:
+                batch = self.zotero_client.items(
+                    itemKey=",".join(batch_keys), limit=len(batch_keys)
+                )
+                items_by_key.update((item.get("key"), item) for item in batch)
+            except Exception as e:
+                logger.warning(f"Batch item fetch failed, falling back to single fetches: {e}")
+
         for i, item_key in enumerate(ids):
             try:
                 # Get full item data from Zotero
-                zotero_item = self.zotero_client.item(item_key)
+                zotero_item = items_by_key.get(item_key) or self.zotero_client.item(item_key)
 
                 enriched_result = {
                     "item_key": item_key,
@@ -5,26 +5,275 @@ Note: ChatGPT requires specific tool names "search" and "fetch", and so they
 are defined and used and piped through to the main server tools. See bottom of file for details.
 """
 
-from typing import Dict, List, Literal, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, Union
 import os
 import sys
 import uuid
 import asyncio
+import copy
+import io
 import json
 import re
+import tempfile
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
 
 from fastmcp import Context, FastMCP
 
 from zotero_mcp.client import (
-    convert_to_markdown,
+    convert_to_markdown_stream,
+    download_attachment,
     format_item_metadata,
     generate_bibtex,
     get_attachment_details,
     get_zotero_client,
 )
-from zotero_mcp.utils import format_creators, clean_html
+from zotero_mcp.utils import (
+    TTLCache,
+    clean_html,
+    extract_citation_key,
+    format_creators,
+    json_dumps,
+    json_loads,
+)
+
+try:
+    from zotero_mcp.better_bibtex_client import (
+        ZoteroBetterBibTexAPI,
+        get_color_category,
+        process_annotation,
+    )
+except ImportError:  # Better BibTeX support is optional
+    ZoteroBetterBibTexAPI = get_color_category = process_annotation = None
+try:
+    from zotero_mcp.pdfannots_helper import ensure_pdfannots_installed, extract_annotations_from_pdf
+except ImportError:  # PDF annotation extraction is optional
+    ensure_pdfannots_installed = extract_annotations_from_pdf = None
+
+# Semantic search configuration written by `zotero-mcp setup`
+_CONFIG_PATH = Path.home() / ".config" / "zotero-mcp" / "config.json"
+
+_search_lock = threading.Lock()
+
+_tag_name = itemgetter("tag")
+
+
+@lru_cache(maxsize=1)
+def _verbose() -> bool:
+    """
+    Whether progress messages should be sent to the client.
+
+    Enabled with ZOTERO_MCP_VERBOSE=1. Resolved on first use because the CLI
+    applies environment settings after importing this module.
+    """
+    return os.getenv("ZOTERO_MCP_VERBOSE") == "1"
+
+
+async def _zotero_call(func):
+    """
+    Run ``func(zot)`` in a worker thread with that thread's Zotero client.
+
+    pyzotero clients keep query parameters between requests, so each thread
+    uses its own cached client instead of sharing one across concurrent calls.
+
+    Args:
+        func: Callable taking a Zotero client
+
+    Returns:
+        The callable's return value
+    """
+    return await asyncio.to_thread(lambda: func(get_zotero_client()))
+
+
+# Short-lived caches for lookups that tools repeat within a session. Entries
+# expire quickly so edits made in Zotero itself show up without a restart.
+_item_cache = TTLCache(maxsize=1024, ttl=60)
+_collection_cache = TTLCache(maxsize=256, ttl=60)
+_tags_cache = TTLCache(maxsize=16, ttl=60)
+# Better BibTeX citation keys found by title search
+_citekey_cache = TTLCache(maxsize=1024, ttl=300)
+# Semantic search results. `zotero-mcp update-db` rebuilds the index from
+# another process without clearing this cache, so entries expire as well.
+_search_results_cache = TTLCache(maxsize=512, ttl=60)
+
+
+async def _get_item(item_key: str) -> dict:
+    """Get a Zotero item, served from the item cache when possible."""
+    item = _item_cache.get(item_key)
+    if item is None:
+        item = await _zotero_call(lambda zot: zot.item(item_key))
+        if item:
+            _item_cache.set(item_key, item)
+    return item
+
+
+def _get_item_sync(zot, item_key: str) -> dict:
+    """Get a Zotero item with the given client, served from the item cache when possible."""
+    item = _item_cache.get(item_key)
+    if item is None:
+        item = zot.item(item_key)
+        if item:
+            _item_cache.set(item_key, item)
+    return item
+
+
+async def _get_collection(collection_key: str) -> dict:
+    """Get a Zotero collection, served from the collection cache when possible."""
+    collection = _collection_cache.get(collection_key)
+    if collection is None:
+        collection = await _zotero_call(lambda zot: zot.collection(collection_key))
+        if collection:
+            _collection_cache.set(collection_key, collection)
+    return collection
+
+
+async def _get_tags(limit: int | None = None) -> list[str]:
+    """Get the library's tags, served from the tag cache when possible."""
+    tags = _tags_cache.get(limit)
+    if tags is None:
+        tags = await _zotero_call(lambda zot: zot.tags(limit=limit))
+        _tags_cache.set(limit, tags)
+    return tags
+
+
+def _format_tags(tags) -> str:
+    """Format Zotero tag objects as space-separated inline code spans."""
+    return " ".join(map("`{}`".format, map(_tag_name, tags)))
+
+
+# Paragraph and line-break tags in note HTML, replaced in a single pass
+_NOTE_HTML_RE = re.compile(r"</?p>|<br/?>")
+_NOTE_HTML_REPLACEMENTS = {"<p>": "", "</p>": "\n\n", "<br/>": "\n", "<br>": "\n"}
+
+
+def _note_html_replacement(match: re.Match) -> str:
+    return _NOTE_HTML_REPLACEMENTS[match.group(0)]
+
+
+# Row templates, with the bound str.format looked up once
+_item_block = (
+    "{heading} {index}. {title}\n"
+    "**Type:** {item_type}\n"
+    "**Item Key:** {key}\n"
+    "**Date:** {date}\n"
+    "{added}"
+    "**Authors:** {authors}\n"
+    "{abstract}"
+    "{tags}"
+).format
+
+_semantic_result_block = (
+    "## {index}. {title}\n"
+    "**Similarity Score:** {score:.3f}\n"
+    "**Type:** {item_type}\n"
+    "**Item Key:** {key}\n"
+    "**Authors:** {authors}\n"
+    "{extras}"
+).format
+
+
+def _format_item(
+    index: int,
+    item: dict,
+    heading: str = "##",
+    abstract_limit: int = 200,
+    details: bool = True,
+    show_added: bool = False,
+) -> str:
+    """
+    Format one item of a search or listing as a markdown block.
+
+    Args:
+        index: Position of the item in the results (1-based)
+        item: Zotero item dictionary
+        heading: Markdown heading marker for the title line
+        abstract_limit: Maximum abstract length before truncation
+        details: Whether to include the abstract and tags
+        show_added: Whether to include the date the item was added
+
+    Returns:
+        The block, ending with a newline so joined blocks are blank-line separated
+    """
+    data = item.get("data", {})
+    abstract = data.get("abstractNote") if details else None
+    tags = data.get("tags") if details else None
+    if abstract and len(abstract) > abstract_limit:
+        abstract = abstract[:abstract_limit] + "..."
+
+    return _item_block(
+        heading=heading,
+        index=index,
+        title=data.get("title", "Untitled"),
+        item_type=data.get("itemType", "unknown"),
+        key=item.get("key", ""),
+        date=data.get("date", "No date"),
+        added=f"**Added:** {data.get('dateAdded', 'Unknown')}\n" if show_added else "",
+        authors=format_creators(data.get("creators", [])),
+        abstract=f"**Abstract:** {abstract}\n" if abstract else "",
+        tags=f"**Tags:** {_format_tags(tags)}\n" if tags else "",
+    )
+
+
+@lru_cache(maxsize=4)
+def _create_search(config_path: str):
+    from zotero_mcp.semantic_search import create_semantic_search
+
+    return create_semantic_search(config_path)
+
+
+def _get_search(config_path: str):
+    """
+    Get the shared semantic search instance for a config file.
+
+    Creating the instance loads the embedding model and opens the ChromaDB
+    collection, so it is built once per config path and reused across tool calls.
+
+    Args:
+        config_path: Path to the semantic search configuration file
+
+    Returns:
+        A ZoteroSemanticSearch instance
+    """
+    with _search_lock:
+        return _create_search(config_path)
+
+
+def _cached_search(query: str, limit: int, filters_key: str) -> dict:
+    """
+    Run a semantic search, serving identical successful queries from the cache.
+
+    Error results are not cached, so the next call retries.
+
+    Args:
+        query: Search query text
+        limit: Maximum number of results
+        filters_key: Filters serialized with ``_filters_key``
+
+    Returns:
+        The results dict from ``ZoteroSemanticSearch.search``; a private copy
+        so callers can't alter the cached entry
+    """
+    key = (query, limit, filters_key)
+    results = _search_results_cache.get(key)
+    if results is None:
+        search = _get_search(str(_CONFIG_PATH))
+        results = search.search(query=query, limit=limit, filters=json.loads(filters_key))
+        if results.get("error"):
+            return results
+        _search_results_cache.set(key, results)
+    return copy.deepcopy(results)
+
+
+def _filters_key(filters: dict | None) -> str:
+    """Serialize search filters into a stable, hashable cache key."""
+    return json.dumps(filters, sort_keys=True, separators=(",", ":"))
+
 
 @asynccontextmanager
 async def server_lifespan(server: FastMCP):
@@ -33,12 +282,8 @@ async def server_lifespan(server: FastMCP):
 
     # Check for semantic search auto-update on startup
     try:
-        from zotero_mcp.semantic_search import create_semantic_search
-
-        config_path = Path.home() / ".config" / "zotero-mcp" / "config.json"
-
-        if config_path.exists():
-            search = create_semantic_search(str(config_path))
+        if _CONFIG_PATH.exists():
+            search = _get_search(str(_CONFIG_PATH))
 
             if search.should_update_database():
                 sys.stderr.write("Auto-updating semantic search database...\n")
@@ -47,6 +292,7 @@ async def server_lifespan(server: FastMCP):
                 async def background_update():
                     try:
                         stats = search.update_database(extract_fulltext=False)
+                        _search_results_cache.clear()
                         sys.stderr.write(f"Database update completed: {stats.get('processed_items', 0)} items processed\n")
                     except Exception as e:
                         sys.stderr.write(f"Background database update failed: {e}\n")
@@ -70,7 +316,7 @@ mcp = FastMCP("Zotero", lifespan=server_lifespan)
     name="zotero_search_items",
     description="Search for items in your Zotero library, given a query string."
 )
-def search_items(
+async def search_items(
     query: str,
     qmode: Literal["titleCreatorYear", "everything"] = "titleCreatorYear",
     item_type: str = "-attachment",  # Exclude attachments by default
@@ -97,21 +343,20 @@ def search_items(
         if not query.strip():
             return "Error: Search query cannot be empty"
 
-        tag_condition_str = ""
-        if tag:
-            tag_condition_str = f" with tags: '{', '.join(tag)}'"
-        else :
+        if not tag:
             tag = []
 
-        ctx.info(f"Searching Zotero for '{query}'{tag_condition_str}")
-        zot = get_zotero_client()
+        tag_condition_str = f" with tags: '{', '.join(tag)}'" if tag else ""
+        if _verbose():
+            await ctx.info(f"Searching Zotero for '{query}'{tag_condition_str}")
 
         if isinstance(limit, str):
             limit = int(limit)
 
         # Search using the query parameters
-        zot.add_parameters(q=query, qmode=qmode, itemType=item_type, limit=limit, tag=tag)
-        results = zot.items()
+        results = await _zotero_call(
+            lambda zot: zot.items(q=query, qmode=qmode, itemType=item_type, limit=limit, tag=tag)
+        )
 
         if not results:
             return f"No items found matching query: '{query}'{tag_condition_str}"
@@ -119,42 +364,15 @@ def search_items(
         # Format results as markdown
         output = [f"# Search Results for '{query}'", f"{tag_condition_str}", ""]
 
-        for i, item in enumerate(results, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
-
-            # Build the formatted entry
-            output.append(f"## {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Authors:** {creators_str}")
-
-            # Add abstract snippet if present
-            if abstract := data.get("abstractNote"):
-                # Limit abstract length for search results
-                abstract_snippet = abstract[:200] + "..." if len(abstract) > 200 else abstract
-                output.append(f"**Abstract:** {abstract_snippet}")
-
-            # Add tags if present
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
-
-            output.append("")  # Empty line between items
+        output.extend(
+            _format_item(i, item)
+            for i, item in enumerate(results, 1)
+        )
 
         return "\n".join(output)
 
     except Exception as e:
-        ctx.error(f"Error searching Zotero: {str(e)}")
+        await ctx.error(f"Error searching Zotero: {str(e)}")
         return f"Error searching Zotero: {str(e)}"
 
 @mcp.tool(
@@ -162,7 +380,7 @@ def search_items(
     description="Search for items in your Zotero library by tag. " \
     "Conditions are ANDed, each term supports disjunction`||` and exclusion`-`."
 )
-def search_by_tag(
+async def search_by_tag(
     tag: list[str],
     item_type: str = "-attachment",
     limit: int | str | None = 10,
@@ -194,15 +412,15 @@ def search_by_tag(
         if not tag:
             return "Error: Tag cannot be empty"
 
-        ctx.info(f"Searching Zotero for tag '{tag}'")
-        zot = get_zotero_client()
+        await ctx.info(f"Searching Zotero for tag '{tag}'")
 
         if isinstance(limit, str):
             limit = int(limit)
 
         # Search using the query parameters
-        zot.add_parameters(q="", tag=tag, itemType=item_type, limit=limit)
-        results = zot.items()
+        results = await _zotero_call(
+            lambda zot: zot.items(q="", tag=tag, itemType=item_type, limit=limit)
+        )
 
         if not results:
             return f"No items found with tag: '{tag}'"
@@ -210,49 +428,22 @@ def search_by_tag(
         # Format results as markdown
         output = [f"# Search Results for Tag: '{tag}'", ""]
 
-        for i, item in enumerate(results, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
-
-            # Build the formatted entry
-            output.append(f"## {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Authors:** {creators_str}")
-
-            # Add abstract snippet if present
-            if abstract := data.get("abstractNote"):
-                # Limit abstract length for search results
-                abstract_snippet = abstract[:200] + "..." if len(abstract) > 200 else abstract
-                output.append(f"**Abstract:** {abstract_snippet}")
-
-            # Add tags if present
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
-
-            output.append("")  # Empty line between items
+        output.extend(
+            _format_item(i, item)
+            for i, item in enumerate(results, 1)
+        )
 
         return "\n".join(output)
 
     except Exception as e:
-        ctx.error(f"Error searching Zotero: {str(e)}")
+        await ctx.error(f"Error searching Zotero: {str(e)}")
         return f"Error searching Zotero: {str(e)}"
 
 @mcp.tool(
     name="zotero_get_item_metadata",
     description="Get detailed metadata for a specific Zotero item by its key."
 )
-def get_item_metadata(
+async def get_item_metadata(
     item_key: str,
     include_abstract: bool = True,
     format: Literal["markdown", "bibtex"] = "markdown",
@@ -272,29 +463,159 @@ def get_item_metadata(
         Formatted item metadata (markdown or BibTeX)
     """
     try:
-        ctx.info(f"Fetching metadata for item {item_key} in {format} format")
-        zot = get_zotero_client()
+        if _verbose():
+            await ctx.info(f"Fetching metadata for item {item_key} in {format} format")
 
-        item = zot.item(item_key)
+        item = await _get_item(item_key)
         if not item:
             return f"No item found with key: {item_key}"
 
         if format == "bibtex":
-            return generate_bibtex(item)
+            return await asyncio.to_thread(generate_bibtex, item)
         else:
             return format_item_metadata(item, include_abstract)
 
     except Exception as e:
-        ctx.error(f"Error fetching item metadata: {str(e)}")
+        await ctx.error(f"Error fetching item metadata: {str(e)}")
         return f"Error fetching item metadata: {str(e)}"
 
 
+def _spool_fulltext(chunks: Iterable[str], inline_limit: int | None) -> tuple[str, str | None, int]:
+    """
+    Collect full text chunks in memory, spilling to a file once they exceed a limit.
+
+    Args:
+        chunks: Pieces of the full text, e.g. one per PDF page
+        inline_limit: Maximum characters to keep in memory (None for no limit,
+            a negative value to always write to a file)
+
+    Returns:
+        (text, None, line_count) when the text was kept in memory, otherwise
+        ("", path, line_count) for the persistent temporary file it was saved to
+    """
+    buffer = io.StringIO()
+    size = 0
+    newlines = 0
+    chunks = iter(chunks)
+    for chunk in chunks:
+        buffer.write(chunk)
+        size += len(chunk)
+        newlines += chunk.count("\n")
+        if inline_limit is not None and size > inline_limit:
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", newline="", prefix="zotero-fulltext-", suffix=".md",
+                delete=False
+            ) as f:
+                f.write(buffer.getvalue())
+                buffer.close()
+                for chunk in chunks:
+                    f.write(chunk)
+                    newlines += chunk.count("\n")
+            return "", f.name, newlines + 1
+    return buffer.getvalue(), None, newlines + 1
+
+
+def _paginate_lines(lines: list[str], offset: int = 0, max_lines: int | None = None) -> str:
+    """
+    Join a window of output lines, noting the window when the output is partial.
+
+    Args:
+        lines: All output lines
+        offset: Index of the first line to return
+        max_lines: Maximum number of lines to return (None for all remaining)
+
+    Returns:
+        The joined window of lines
+    """
+    total = len(lines)
+    if offset <= 0 and (max_lines is None or max_lines >= total):
+        return "\n".join(lines)
+
+    offset = max(offset, 0)
+    if offset >= total:
+        return f"--- offset {offset} is beyond the end ({total} lines) ---"
+    end = total if max_lines is None else min(offset + max_lines, total)
+    window = lines[offset:end]
+    window.append(f"--- lines {offset}-{end} of {total} ---")
+    return "\n".join(window)
+
+
+def _paginate_file(path: str, total: int, offset: int = 0, max_lines: int | None = None) -> str:
+    """
+    Read a window of lines from a text file, like ``_paginate_lines``.
+
+    Only the lines up to the end of the window are read.
+
+    Args:
+        path: Text file to read
+        total: Number of lines in the file
+        offset: Index of the first line to return
+        max_lines: Maximum number of lines to return (None for all remaining)
+
+    Returns:
+        The joined window of lines
+    """
+    offset = max(offset, 0)
+    if offset >= total:
+        return f"--- offset {offset} is beyond the end ({total} lines) ---"
+    end = total if max_lines is None else min(offset + max_lines, total)
+    with open(path, encoding="utf-8", newline="\n") as f:
+        window = [line.rstrip("\n") for line in islice(f, offset, end)]
+    window.append(f"--- lines {offset}-{end} of {total} ---")
+    return "\n".join(window)
+
+
+async def _format_fulltext(
+    metadata: str,
+    chunks: Iterable[str],
+    return_content: bool,
+    max_inline_chars: int | None,
+    offset: int = 0,
+    max_lines: int | None = None,
+) -> str:
+    """Inline the full text below the metadata, or save it to a file and point to it."""
+    inline_limit = max_inline_chars if return_content else -1
+    text, path, line_count = await asyncio.to_thread(_spool_fulltext, chunks, inline_limit)
+
+    if path is None:
+        if offset or max_lines is not None:
+            text = _paginate_lines(text.split("\n"), offset, max_lines)
+        return f"{metadata}\n\n---\n\n## Full Text\n\n{text}"
+
+    size = os.path.getsize(path)
+    saved = f"Full text saved to `{path}` ({size} bytes, {line_count} lines)"
+    if offset or max_lines is not None:
+        if not return_content:
+            return f"{metadata}\n\n---\n\n{saved}; offset and max_lines were not applied"
+        # A line window was asked for, so return it from the saved file
+        window = await asyncio.to_thread(_paginate_file, path, line_count, offset, max_lines)
+        return f"{metadata}\n\n---\n\n{saved}\n\n## Full Text\n\n{window}"
+    return f"{metadata}\n\n---\n\n{saved}"
+
+
+async def _indexed_fulltext(attachment_key: str, ctx: Context) -> str | None:
+    """Return the text Zotero indexed for an attachment, or None if there is none."""
+    try:
+        full_text_data = await _zotero_call(lambda zot: zot.fulltext_item(attachment_key))
+    except Exception as fulltext_error:
+        await ctx.info(f"Couldn't retrieve indexed full text: {str(fulltext_error)}")
+        return None
+    if full_text_data and full_text_data.get("content"):
+        await ctx.info("Successfully retrieved full text from Zotero's index")
+        return full_text_data["content"]
+    return None
+
+
 @mcp.tool(
     name="zotero_get_item_fulltext",
     description="Get the full text content of a Zotero item by its key."
 )
-def get_item_fulltext(
+async def get_item_fulltext(
     item_key: str,
+    return_content: bool = True,
+    max_inline_chars: int | None = 50000,
+    offset: int = 0,
+    max_lines: int | None = None,
     *,
     ctx: Context
 ) -> str:
@@ -303,72 +624,149 @@ def get_item_fulltext(
 
     Args:
         item_key: Zotero item key/ID
+        return_content: Whether to return the text inline; if False it is saved to a file
+        max_inline_chars: Save the text to a file instead when it is longer than
+            this (None to always return it inline)
+        offset: First line of the full text to return; also applied to text
+            saved to a file when return_content is True
+        max_lines: Maximum number of full text lines to return
         ctx: MCP context
 
     Returns:
-        Markdown-formatted item full text
+        Markdown-formatted item full text, or the path of the file it was saved to
     """
     try:
-        ctx.info(f"Fetching full text for item {item_key}")
-        zot = get_zotero_client()
+        await ctx.info(f"Fetching full text for item {item_key}")
 
         # First get the item metadata
-        item = zot.item(item_key)
+        item = await _get_item(item_key)
         if not item:
             return f"No item found with key: {item_key}"
 
         # Get item metadata in markdown format
         metadata = format_item_metadata(item, include_abstract=True)
 
+        # Try Zotero's full text index first, using the best attachment the API
+        # already linked in the item, before looking through its children
+        if item.get("data", {}).get("itemType") == "attachment":
+            indexed_key = item_key
+        else:
+            href = item.get("links", {}).get("attachment", {}).get("href", "")
+            indexed_key = href.rstrip("/").rsplit("/", 1)[-1] if href else None
+
+        if indexed_key:
+            content = await _indexed_fulltext(indexed_key, ctx)
+            if content:
+                return await _format_fulltext(
+                    metadata, [content], return_content, max_inline_chars, offset, max_lines
+                )
+
         # Try to get attachment details
-        attachment = get_attachment_details(zot, item)
+        attachment = await _zotero_call(lambda zot: get_attachment_details(zot, item))
         if not attachment:
             return f"{metadata}\n\n---\n\nNo suitable attachment found for this item."
 
-        ctx.info(f"Found attachment: {attachment.key} ({attachment.content_type})")
+        await ctx.info(f"Found attachment: {attachment.key} ({attachment.content_type})")
 
-        # Try fetching full text from Zotero's full text index first
-        try:
-            full_text_data = zot.fulltext_item(attachment.key)
-            if full_text_data and "content" in full_text_data and full_text_data["content"]:
-                ctx.info("Successfully retrieved full text from Zotero's index")
-                return f"{metadata}\n\n---\n\n## Full Text\n\n{full_text_data['content']}"
-        except Exception as fulltext_error:
-            ctx.info(f"Couldn't retrieve indexed full text: {str(fulltext_error)}")
+        if attachment.key != indexed_key:
+            content = await _indexed_fulltext(attachment.key, ctx)
+            if content:
+                return await _format_fulltext(
+                    metadata, [content], return_content, max_inline_chars, offset, max_lines
+                )
 
         # If we couldn't get indexed full text, try to download and convert the file
         try:
-            ctx.info(f"Attempting to download and convert attachment {attachment.key}")
+            await ctx.info(f"Attempting to download and convert attachment {attachment.key}")
 
             # Download the file to a temporary location
-            import tempfile
-            import os
-
             with tempfile.TemporaryDirectory() as tmpdir:
                 file_path = os.path.join(tmpdir, attachment.filename or f"{attachment.key}.pdf")
-                zot.dump(attachment.key, filename=os.path.basename(file_path), path=tmpdir)
+                await _zotero_call(lambda zot: download_attachment(zot, attachment.key, file_path))
 
                 if os.path.exists(file_path):
-                    ctx.info(f"Downloaded file to {file_path}, converting to markdown")
-                    converted_text = convert_to_markdown(file_path)
-                    return f"{metadata}\n\n---\n\n## Full Text\n\n{converted_text}"
+                    await ctx.info(f"Downloaded file to {file_path}, converting to markdown")
+                    # Pages are converted as the text is collected, inside the
+                    # worker thread and before the temporary directory goes away
+                    return await _format_fulltext(
+                        metadata, convert_to_markdown_stream(file_path), return_content, max_inline_chars,
+                        offset, max_lines
+                    )
                 else:
                     return f"{metadata}\n\n---\n\nFile download failed."
         except Exception as download_error:
-            ctx.error(f"Error downloading/converting file: {str(download_error)}")
+            await ctx.error(f"Error downloading/converting file: {str(download_error)}")
             return f"{metadata}\n\n---\n\nError accessing attachment: {str(download_error)}"
 
     except Exception as e:
-        ctx.error(f"Error fetching item full text: {str(e)}")
+        await ctx.error(f"Error fetching item full text: {str(e)}")
         return f"Error fetching item full text: {str(e)}"
 
 
+def _collection_lines(collections: list[dict]) -> Iterator[str]:
+    """
+    Yield the lines of a collection listing, nested by parent collection.
+
+    Args:
+        collections: Zotero collection dictionaries
+
+    Yields:
+        One markdown list line per collection
+    """
+    # Create a mapping of collection IDs to their data
+    collection_map = {c["key"]: c for c in collections}
+
+    # Create a mapping of parent to child collections
+    # Only add entries for collections that actually exist
+    hierarchy = {}
+    for coll in collections:
+        parent_key = coll["data"].get("parentCollection")
+        # Handle various representations of "no parent"
+        if parent_key in ["", None] or not parent_key:
+            parent_key = None  # Normalize to None
+
+        if parent_key not in hierarchy:
+            hierarchy[parent_key] = []
+        hierarchy[parent_key].append(coll["key"])
+
+    # Sort each child list once for consistent output
+    for child_keys in hierarchy.values():
+        child_keys.sort()
+
+    # Start with top-level collections (those with None as parent)
+    top_level_keys = hierarchy.get(None, [])
+
+    if not top_level_keys:
+        # If no clear hierarchy, just list all collections
+        yield "Collections (flat list):"
+        for coll in sorted(collections, key=lambda x: x["data"].get("name", "")):
+            name = coll["data"].get("name", "Unnamed Collection")
+            key = coll["key"]
+            yield f"- **{name}** (Key: {key})"
+        return
+
+    # Display hierarchical structure with an iterative depth-first walk
+    stack = [(key, 0) for key in reversed(top_level_keys)]
+    while stack:
+        key, level = stack.pop()
+        if key not in collection_map:
+            continue
+
+        name = collection_map[key]["data"].get("name", "Unnamed Collection")
+        # Indentation reflects the hierarchy level
+        yield f"{'  ' * level}- **{name}** (Key: {key})"
+
+        stack.extend((child_key, level + 1) for child_key in reversed(hierarchy.get(key, [])))
+
+
 @mcp.tool(
     name="zotero_get_collections",
     description="List all collections in your Zotero library."
 )
-def get_collections(
+async def get_collections(
     limit: int | str | None = None,
+    offset: int = 0,
+    max_lines: int | None = None,
     *,
     ctx: Context
 ) -> str:
@@ -377,81 +775,44 @@ def get_collections(
 
     Args:
         limit: Maximum number of collections to return
+        offset: First line of the collection listing to return
+        max_lines: Maximum number of listing lines to return
         ctx: MCP context
 
     Returns:
         Markdown-formatted list of collections
     """
     try:
-        ctx.info("Fetching collections")
-        zot = get_zotero_client()
+        if _verbose():
+            await ctx.info("Fetching collections")
 
         if isinstance(limit, str):
             limit = int(limit)
 
-        collections = zot.collections(limit=limit)
+        collections = await _zotero_call(lambda zot: zot.collections(limit=limit))
 
         # Always return the header, even if empty
-        output = ["# Zotero Collections", ""]
+        buf = io.StringIO()
+        buf.write("# Zotero Collections\n\n")
 
         if not collections:
-            output.append("No collections found in your Zotero library.")
-            return "\n".join(output)
-
-        # Create a mapping of collection IDs to their data
-        collection_map = {c["key"]: c for c in collections}
-
-        # Create a mapping of parent to child collections
-        # Only add entries for collections that actually exist
-        hierarchy = {}
-        for coll in collections:
-            parent_key = coll["data"].get("parentCollection")
-            # Handle various representations of "no parent"
-            if parent_key in ["", None] or not parent_key:
-                parent_key = None  # Normalize to None
-
-            if parent_key not in hierarchy:
-                hierarchy[parent_key] = []
-            hierarchy[parent_key].append(coll["key"])
-
-        # Function to recursively format collections
-        def format_collection(key, level=0):
-            if key not in collection_map:
-                return []
-
-            coll = collection_map[key]
-            name = coll["data"].get("name", "Unnamed Collection")
+            buf.write("No collections found in your Zotero library.")
+            return buf.getvalue()
 
-            # Create indentation for hierarchy
-            indent = "  " * level
-            lines = [f"{indent}- **{name}** (Key: {key})"]
-
-            # Add children if they exist
-            child_keys = hierarchy.get(key, [])
-            for child_key in sorted(child_keys):  # Sort for consistent output
-                lines.extend(format_collection(child_key, level + 1))
-
-            return lines
-
-        # Start with top-level collections (those with None as parent)
-        top_level_keys = hierarchy.get(None, [])
-
-        if not top_level_keys:
-            # If no clear hierarchy, just list all collections
-            output.append("Collections (flat list):")
-            for coll in sorted(collections, key=lambda x: x["data"].get("name", "")):
-                name = coll["data"].get("name", "Unnamed Collection")
-                key = coll["key"]
-                output.append(f"- **{name}** (Key: {key})")
+        lines = _collection_lines(collections)
+        if offset or max_lines is not None:
+            buf.write(_paginate_lines(list(lines), offset, max_lines))
         else:
-            # Display hierarchical structure
-            for key in sorted(top_level_keys):
-                output.extend(format_collection(key))
+            # Write the listing straight into the buffer
+            buf.write(next(lines, ""))
+            for line in lines:
+                buf.write("\n")
+                buf.write(line)
 
-        return "\n".join(output)
+        return buf.getvalue()
 
     except Exception as e:
-        ctx.error(f"Error fetching collections: {str(e)}")
+        await ctx.error(f"Error fetching collections: {str(e)}")
         error_msg = f"Error fetching collections: {str(e)}"
         return f"# Zotero Collections\n\n{error_msg}"
 
@@ -460,7 +821,7 @@ def get_collections(
     name="zotero_get_collection_items",
     description="Get all items in a specific Zotero collection."
 )
-def get_collection_items(
+async def get_collection_items(
     collection_key: str,
     limit: int | str | None = 50,
     *,
@@ -478,51 +839,39 @@ def get_collection_items(
         Markdown-formatted list of items in the collection
     """
     try:
-        ctx.info(f"Fetching items for collection {collection_key}")
-        zot = get_zotero_client()
+        if _verbose():
+            await ctx.info(f"Fetching items for collection {collection_key}")
 
-        # First get the collection details
+        if isinstance(limit, str):
+            limit = int(limit)
+
+        # Get the collection details and its items concurrently
+        collection, items = await asyncio.gather(
+            _get_collection(collection_key),
+            _zotero_call(lambda zot: zot.collection_items(collection_key, limit=limit)),
+            return_exceptions=True,
+        )
+        if isinstance(items, BaseException):
+            raise items
         try:
-            collection = zot.collection(collection_key)
             collection_name = collection["data"].get("name", "Unnamed Collection")
         except Exception:
             collection_name = f"Collection {collection_key}"
-
-        if isinstance(limit, str):
-            limit = int(limit)
-
-        # Then get the items
-        items = zot.collection_items(collection_key, limit=limit)
         if not items:
             return f"No items found in collection: {collection_name} (Key: {collection_key})"
 
         # Format items as markdown
         output = [f"# Items in Collection: {collection_name}", ""]
 
-        for i, item in enumerate(items, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
-
-            # Build the formatted entry
-            output.append(f"## {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Authors:** {creators_str}")
-
-            output.append("")  # Empty line between items
+        output.extend(
+            _format_item(i, item, details=False)
+            for i, item in enumerate(items, 1)
+        )
 
         return "\n".join(output)
 
     except Exception as e:
-        ctx.error(f"Error fetching collection items: {str(e)}")
+        await ctx.error(f"Error fetching collection items: {str(e)}")
         return f"Error fetching collection items: {str(e)}"
 
 
@@ -530,7 +879,7 @@ def get_collection_items(
     name="zotero_get_item_children",
     description="Get all child items (attachments, notes) for a specific Zotero item."
 )
-def get_item_children(
+async def get_item_children(
     item_key: str,
     *,
     ctx: Context
@@ -546,18 +895,20 @@ def get_item_children(
         Markdown-formatted list of child items
     """
     try:
-        ctx.info(f"Fetching children for item {item_key}")
-        zot = get_zotero_client()
+        await ctx.info(f"Fetching children for item {item_key}")
 
-        # First get the parent item details
+        # Get the parent item details and the children concurrently
+        parent, children = await asyncio.gather(
+            _get_item(item_key),
+            _zotero_call(lambda zot: zot.children(item_key)),
+            return_exceptions=True,
+        )
+        if isinstance(children, BaseException):
+            raise children
         try:
-            parent = zot.item(item_key)
             parent_title = parent["data"].get("title", "Untitled Item")
         except Exception:
             parent_title = f"Item {item_key}"
-
-        # Then get the children
-        children = zot.children(item_key)
         if not children:
             return f"No child items found for: {parent_title} (Key: {item_key})"
 
@@ -607,8 +958,7 @@ def get_item_children(
                 note_text = data.get("note", "")
 
                 # Clean up HTML in notes
-                note_text = note_text.replace("<p>", "").replace("</p>", "\n\n")
-                note_text = note_text.replace("<br/>", "\n").replace("<br>", "\n")
+                note_text = _NOTE_HTML_RE.sub(_note_html_replacement, note_text)
 
                 # Limit note length for display
                 if len(note_text) > 500:
@@ -636,7 +986,7 @@ def get_item_children(
         return "\n".join(output)
 
     except Exception as e:
-        ctx.error(f"Error fetching item children: {str(e)}")
+        await ctx.error(f"Error fetching item children: {str(e)}")
         return f"Error fetching item children: {str(e)}"
 
 
@@ -644,7 +994,7 @@ def get_item_children(
     name="zotero_get_tags",
     description="Get all tags used in your Zotero library."
 )
-def get_tags(
+async def get_tags(
     limit: int | str | None = None,
     *,
     ctx: Context
@@ -660,37 +1010,32 @@ def get_tags(
         Markdown-formatted list of tags
     """
     try:
-        ctx.info("Fetching tags")
-        zot = get_zotero_client()
+        if _verbose():
+            await ctx.info("Fetching tags")
 
         if isinstance(limit, str):
             limit = int(limit)
 
-        tags = zot.tags(limit=limit)
+        tags = await _get_tags(limit)
         if not tags:
             return "No tags found in your Zotero library."
 
         # Format tags as markdown
         output = ["# Zotero Tags", ""]
 
-        # Sort tags alphabetically
-        sorted_tags = sorted(tags)
+        # Group tags by first letter, then sort each (small) group on its own
+        groups = defaultdict(list)
+        for tag in tags:
+            groups[tag[0].upper() if tag else "#"].append(tag)
 
-        # Group tags alphabetically
-        current_letter = None
-        for tag in sorted_tags:
-            first_letter = tag[0].upper() if tag else "#"
-
-            if first_letter != current_letter:
-                current_letter = first_letter
-                output.append(f"## {current_letter}")
-
-            output.append(f"- `{tag}`")
+        for letter in sorted(groups):
+            output.append(f"## {letter}")
+            output.extend(f"- `{tag}`" for tag in sorted(groups[letter]))
 
         return "\n".join(output)
 
     except Exception as e:
-        ctx.error(f"Error fetching tags: {str(e)}")
+        await ctx.error(f"Error fetching tags: {str(e)}")
         return f"Error fetching tags: {str(e)}"
 
 
@@ -698,7 +1043,7 @@ def get_tags(
     name="zotero_get_recent",
     description="Get recently added items to your Zotero library."
 )
-def get_recent(
+async def get_recent(
     limit: int | str = 10,
     *,
     ctx: Context
@@ -714,8 +1059,8 @@ def get_recent(
         Markdown-formatted list of recent items
     """
     try:
-        ctx.info(f"Fetching {limit} recent items")
-        zot = get_zotero_client()
+        if _verbose():
+            await ctx.info(f"Fetching {limit} recent items")
 
         if isinstance(limit, str):
             limit = int(limit)
@@ -727,39 +1072,24 @@ def get_recent(
             limit = 100
 
         # Get recent items
-        items = zot.items(limit=limit, sort="dateAdded", direction="desc")
+        items = await _zotero_call(
+            lambda zot: zot.items(limit=limit, sort="dateAdded", direction="desc")
+        )
         if not items:
             return "No items found in your Zotero library."
 
         # Format items as markdown
         output = [f"# {limit} Most Recently Added Items", ""]
 
-        for i, item in enumerate(items, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-            date_added = data.get("dateAdded", "Unknown")
-
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
-
-            # Build the formatted entry
-            output.append(f"## {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Added:** {date_added}")
-            output.append(f"**Authors:** {creators_str}")
-
-            output.append("")  # Empty line between items
+        output.extend(
+            _format_item(i, item, details=False, show_added=True)
+            for i, item in enumerate(items, 1)
+        )
 
         return "\n".join(output)
 
     except Exception as e:
-        ctx.error(f"Error fetching recent items: {str(e)}")
+        await ctx.error(f"Error fetching recent items: {str(e)}")
         return f"Error fetching recent items: {str(e)}"
 
 
@@ -767,7 +1097,7 @@ def get_recent(
     name="zotero_batch_update_tags",
     description="Batch update tags across multiple items matching a search query."
 )
-def batch_update_tags(
+async def batch_update_tags(
     query: str,
     add_tags: list[str] | str | None = None,
     remove_tags: list[str] | str | None = None,
@@ -802,30 +1132,26 @@ def batch_update_tags(
         # Handle case where add_tags might be a JSON string instead of list
         if add_tags and isinstance(add_tags, str):
             try:
-                import json
                 add_tags = json.loads(add_tags)
-                ctx.info(f"Parsed add_tags from JSON string: {add_tags}")
+                await ctx.info(f"Parsed add_tags from JSON string: {add_tags}")
             except json.JSONDecodeError:
                 return f"Error: add_tags appears to be malformed JSON string: {add_tags}"
 
         # Handle case where remove_tags might be a JSON string instead of list
         if remove_tags and isinstance(remove_tags, str):
             try:
-                import json
                 remove_tags = json.loads(remove_tags)
-                ctx.info(f"Parsed remove_tags from JSON string: {remove_tags}")
+                await ctx.info(f"Parsed remove_tags from JSON string: {remove_tags}")
             except json.JSONDecodeError:
                 return f"Error: remove_tags appears to be malformed JSON string: {remove_tags}"
 
-        ctx.info(f"Batch updating tags for items matching '{query}'")
-        zot = get_zotero_client()
+        await ctx.info(f"Batch updating tags for items matching '{query}'")
 
         if isinstance(limit, str):
             limit = int(limit)
 
         # Search for items matching the query
-        zot.add_parameters(q=query, limit=limit)
-        items = zot.items()
+        items = await _zotero_call(lambda zot: zot.items(q=query, limit=limit))
 
         if not items:
             return f"No items found matching query: '{query}'"
@@ -835,6 +1161,9 @@ def batch_update_tags(
         skipped_count = 0
         added_tag_counts = {tag: 0 for tag in (add_tags or [])}
         removed_tag_counts = {tag: 0 for tag in (remove_tags or [])}
+        remove_set = frozenset(remove_tags or ())
+        add_list = list(add_tags or ())
+        to_update = []
 
         # Process each item
         for item in items:
@@ -851,11 +1180,11 @@ def batch_update_tags(
             needs_update = False
 
             # Process tags to remove
-            if remove_tags:
+            if remove_set:
                 new_tags = []
                 for tag_obj in current_tags:
                     tag = tag_obj["tag"]
-                    if tag in remove_tags:
+                    if tag in remove_set:
                         removed_tag_counts[tag] += 1
                         needs_update = True
                     else:
@@ -863,29 +1192,43 @@ def batch_update_tags(
                 current_tags = new_tags
 
             # Process tags to add
-            if add_tags:
-                for tag in add_tags:
-                    if tag and tag not in current_tag_values:
-                        current_tags.append({"tag": tag})
+            if add_list:
+                missing = [tag for tag in add_list if tag and tag not in current_tag_values]
+                if missing:
+                    current_tags.extend({"tag": tag} for tag in missing)
+                    for tag in missing:
                         added_tag_counts[tag] += 1
-                        needs_update = True
+                    needs_update = True
 
-            # Update the item if needed
-            # Since we are logging errors we might as well log the update.
+            # Queue the item for update if needed
             if needs_update:
-                try:
-                    item["data"]["tags"] = current_tags
-                    ctx.info(f"Updating item {item.get('key', 'unknown')} with tags: {current_tags}")
-                    result = zot.update_item(item)
-                    ctx.info(f"Update result: {result}")
-                    updated_count += 1
-                except Exception as e:
-                    ctx.error(f"Failed to update item {item.get('key', 'unknown')}: {str(e)}")
-                    # Continue with other items instead of failing completely
-                    skipped_count += 1
+                item["data"]["tags"] = current_tags
+                to_update.append(item)
             else:
                 skipped_count += 1
 
+        # Write the changes through the batch endpoint in groups of 50, so a
+        # failing group doesn't stop the rest. pyzotero's update_items only
+        # reports success as a whole, not per item.
+        pending = iter(to_update)
+        for chunk in iter(lambda: list(islice(pending, 50)), []):
+            # Since we are logging errors we might as well log the update.
+            await ctx.info(f"Updating {len(chunk)} items: {', '.join(item.get('key', 'unknown') for item in chunk)}")
+            for item in chunk:
+                _item_cache.pop(item.get("key"))
+            try:
+                await _zotero_call(lambda zot: zot.update_items(chunk))
+            except Exception as e:
+                await ctx.error(f"Failed to update {len(chunk)} items: {str(e)}")
+                # Continue with other chunks instead of failing completely
+                skipped_count += len(chunk)
+                continue
+
+            updated_count += len(chunk)
+
+        if to_update:
+            _tags_cache.clear()
+
         # Format the response
         response = ["# Batch Tag Update Results", ""]
         response.append(f"Query: '{query}'")
@@ -906,15 +1249,116 @@ def batch_update_tags(
         return "\n".join(response)
 
     except Exception as e:
-        ctx.error(f"Error in batch tag update: {str(e)}")
+        await ctx.error(f"Error in batch tag update: {str(e)}")
         return f"Error in batch tag update: {str(e)}"
 
 
+_QUICK_SEARCH_MODES = {
+    "quicksearch-titleCreatorYear": "titleCreatorYear",
+    "quicksearch-everything": "everything",
+    "everything": "everything",
+}
+
+# Saved searches whose deletion is still in flight
+_pending_deletes: set[asyncio.Task] = set()
+
+
+def _quick_search_params(condition: dict[str, str]) -> dict[str, str] | None:
+    """
+    Map a single advanced search condition onto /items query parameters.
+
+    Only conditions whose meaning is identical under both APIs are mapped:
+    quick search fields with "contains" and exact tag matches. Title or
+    creator conditions are not, because `q` also matches the other fields.
+
+    Returns:
+        The query parameters, or None if a saved search is needed
+    """
+    field = condition["field"]
+    operation = condition["operation"]
+    value = str(condition["value"])
+
+    if field in _QUICK_SEARCH_MODES and operation == "contains":
+        return {"q": value, "qmode": _QUICK_SEARCH_MODES[field]}
+    if field == "tag" and operation == "is":
+        return {"tag": value}
+    return None
+
+
+async def _delete_saved_search(search_key: str) -> None:
+    """Delete a temporary saved search, logging rather than raising on failure."""
+    try:
+        await _zotero_call(lambda zot: zot.delete_saved_search([search_key]))
+    except Exception as e:
+        sys.stderr.write(f"Error cleaning up saved search {search_key}: {e}\n")
+
+
+async def _saved_search_items(
+    conditions: list[dict[str, str]], join_mode: str
+) -> list[dict] | str:
+    """
+    Run an advanced search through a temporary saved search.
+
+    The saved search is deleted in the background once its items are read.
+
+    Returns:
+        The matching items, or an error message
+    """
+    # Build search conditions
+    search_conditions = []
+    for condition in conditions:
+        # Map common field names to Zotero API fields if needed
+        field = condition["field"]
+        operation = condition["operation"]
+        value = condition["value"]
+
+        # Handle special fields
+        if field == "author" or field == "creator":
+            field = "creator"
+        elif field == "year":
+            field = "date"
+            # Convert year to partial date format for matching
+            value = str(value)
+
+        search_conditions.append({
+            "condition": field,
+            "operator": operation,
+            "value": value
+        })
+
+    # Add join mode condition
+    search_conditions.append({
+        "condition": "joinMode",
+        "operator": join_mode,
+        "value": ""
+    })
+
+    # Create a saved search
+    search_name = f"temp_search_{uuid.uuid4().hex[:8]}"
+    saved_search = await _zotero_call(
+        lambda zot: zot.saved_search(search_name, search_conditions)
+    )
+
+    # Extract the search key from the result
+    if not saved_search.get("success"):
+        return f"Error creating saved search: {saved_search.get('failed', 'Unknown error')}"
+
+    search_key = next(iter(saved_search.get("success", {}).values()), None)
+
+    # Execute the saved search, then clean it up without waiting for the deletion
+    try:
+        return await _zotero_call(lambda zot: zot.collection_items(search_key))
+    finally:
+        task = asyncio.create_task(_delete_saved_search(search_key))
+        _pending_deletes.add(task)
+        task.add_done_callback(_pending_deletes.discard)
+
+
 @mcp.tool(
     name="zotero_advanced_search",
     description="Perform an advanced search with multiple criteria."
 )
-def advanced_search(
+async def advanced_search(
     conditions: list[dict[str, str]],
     join_mode: Literal["all", "any"] = "all",
     sort_by: str | None = None,
@@ -944,8 +1388,7 @@ def advanced_search(
         if not conditions:
             return "Error: No search conditions provided"
 
-        ctx.info(f"Performing advanced search with {len(conditions)} conditions")
-        zot = get_zotero_client()
+        await ctx.info(f"Performing advanced search with {len(conditions)} conditions")
 
         # Prepare search parameters
         params = {}
@@ -961,120 +1404,457 @@ def advanced_search(
         # Add limit parameter
         params["limit"] = limit
 
-        # Build search conditions
-        search_conditions = []
+        # Validate conditions
         for i, condition in enumerate(conditions):
             if "field" not in condition or "operation" not in condition or "value" not in condition:
                 return f"Error: Condition {i+1} is missing required fields (field, operation, value)"
 
-            # Map common field names to Zotero API fields if needed
-            field = condition["field"]
-            operation = condition["operation"]
-            value = condition["value"]
-
-            # Handle special fields
-            if field == "author" or field == "creator":
-                field = "creator"
-            elif field == "year":
-                field = "date"
-                # Convert year to partial date format for matching
-                value = str(value)
-
-            search_conditions.append({
-                "condition": field,
-                "operator": operation,
-                "value": value
-            })
-
-        # Add join mode condition
-        search_conditions.append({
-            "condition": "joinMode",
-            "operator": join_mode,
-            "value": ""
-        })
-
-        # Create a saved search
-        search_name = f"temp_search_{uuid.uuid4().hex[:8]}"
-        saved_search = zot.saved_search(
-            search_name,
-            search_conditions
-        )
-
-        # Extract the search key from the result
-        if not saved_search.get("success"):
-            return f"Error creating saved search: {saved_search.get('failed', 'Unknown error')}"
-
-        search_key = next(iter(saved_search.get("success", {}).values()), None)
-
-        # Execute the saved search
-        try:
-            results = zot.collection_items(search_key)
-        finally:
-            # Clean up the temporary saved search
-            try:
-                zot.delete_saved_search([search_key])
-            except Exception as cleanup_error:
-                ctx.warn(f"Error cleaning up saved search: {str(cleanup_error)}")
+        # A single condition that maps onto plain item query parameters needs one
+        # request instead of creating, reading and deleting a saved search
+        quick_params = _quick_search_params(conditions[0]) if len(conditions) == 1 else None
+        if quick_params is not None:
+            results = await _zotero_call(lambda zot: zot.items(**quick_params, **params))
+        else:
+            results = await _saved_search_items(conditions, join_mode)
+            if isinstance(results, str):
+                return results
 
         # Format the results
         if not results:
             return "No items found matching the search criteria."
 
-        output = ["# Advanced Search Results", ""]
-        output.append(f"Found {len(results)} items matching the search criteria:")
-        output.append("")
+        buf = io.StringIO()
+        buf.write("# Advanced Search Results\n\n")
+        buf.write(f"Found {len(results)} items matching the search criteria:\n\n")
 
         # Add search criteria summary
-        output.append("## Search Criteria")
-        output.append(f"Join mode: {join_mode.upper()}")
+        buf.write("## Search Criteria\n")
+        buf.write(f"Join mode: {join_mode.upper()}\n")
 
         for i, condition in enumerate(conditions, 1):
-            output.append(f"{i}. {condition['field']} {condition['operation']} \"{condition['value']}\"")
-
-        output.append("")
+            buf.write(f"{i}. {condition['field']} {condition['operation']} \"{condition['value']}\"\n")
 
         # Format results
-        output.append("## Results")
-
+        buf.write("\n## Results")
         for i, item in enumerate(results, 1):
-            data = item.get("data", {})
-            title = data.get("title", "Untitled")
-            item_type = data.get("itemType", "unknown")
-            date = data.get("date", "No date")
-            key = item.get("key", "")
-
-            # Format creators
-            creators = data.get("creators", [])
-            creators_str = format_creators(creators)
-
-            # Build the formatted entry
-            output.append(f"### {i}. {title}")
-            output.append(f"**Type:** {item_type}")
-            output.append(f"**Item Key:** {key}")
-            output.append(f"**Date:** {date}")
-            output.append(f"**Authors:** {creators_str}")
-
-            # Add abstract snippet if present
-            if abstract := data.get("abstractNote"):
-                # Limit abstract length for search results
-                abstract_snippet = abstract[:150] + "..." if len(abstract) > 150 else abstract
-                output.append(f"**Abstract:** {abstract_snippet}")
-
-            # Add tags if present
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
+            buf.write("\n")
+            buf.write(_format_item(i, item, heading="###", abstract_limit=150))
 
-            output.append("")  # Empty line between items
-
-        return "\n".join(output)
+        return buf.getvalue()
 
     except Exception as e:
-        ctx.error(f"Error in advanced search: {str(e)}")
+        await ctx.error(f"Error in advanced search: {str(e)}")
         return f"Error in advanced search: {str(e)}"
 
 
+def _parent_titles(zot, items: list[dict]) -> dict[str, str]:
+    """
+    Look up the titles of the parent items of several items at once.
+
+    Args:
+        zot: Zotero client
+        items: Child items (notes, annotations) whose parents are needed
+
+    Returns:
+        Parent title by parent key; keys that could not be fetched are missing
+    """
+    parent_keys = list(dict.fromkeys(
+        parent_key for item in items
+        if (parent_key := item.get("data", {}).get("parentItem"))
+    ))
+    titles = {}
+    missing = []
+    for parent_key in parent_keys:
+        parent = _item_cache.get(parent_key)
+        if parent is None:
+            missing.append(parent_key)
+        else:
+            titles[parent_key] = parent.get("data", {}).get("title", "Untitled")
+
+    keys = iter(missing)
+    # The API accepts up to 50 comma-separated item keys per request
+    while chunk := list(islice(keys, 50)):
+        try:
+            parents = zot.items(itemKey=",".join(chunk), limit=len(chunk))
+        except Exception:
+            continue
+        for parent in parents:
+            _item_cache.set(parent["key"], parent)
+            titles[parent["key"]] = parent.get("data", {}).get("title", "Untitled")
+    return titles
+
+
+# Attachments downloaded and run through pdfannots2json at the same time
+_PDF_EXTRACTION_WORKERS = 8
+
+
+def _extract_pdf_annotations(attachment: dict, item_key: str, tmpdir: str) -> list[dict]:
+    """
+    Download one PDF attachment and extract its annotations.
+
+    Runs in a worker thread, so it uses that thread's own Zotero client and a
+    subdirectory of tmpdir for the file and any extracted images.
+
+    Args:
+        attachment: Zotero attachment item dictionary
+        item_key: Key of the parent item the annotations belong to
+        tmpdir: Shared temporary directory
+
+    Returns:
+        Zotero-like annotation dictionaries
+    """
+    att_key = attachment.get("key", "")
+    att_dir = os.path.join(tmpdir, att_key)
+    os.makedirs(att_dir, exist_ok=True)
+    file_path = os.path.join(att_dir, f"{att_key}.pdf")
+    download_attachment(get_zotero_client(), att_key, file_path)
+
+    if not os.path.exists(file_path):
+        return []
+
+    pdf_annotations = []
+    for ext in extract_annotations_from_pdf(file_path, att_dir):
+        # Skip empty annotations
+        if not ext.get("annotatedText") and not ext.get("comment"):
+            continue
+
+        # Create Zotero-like annotation object
+        pdf_anno = {
+            "key": f"pdf_{att_key}_{ext.get('id', uuid.uuid4().hex[:8])}",
+            "data": {
+                "itemType": "annotation",
+                "annotationType": ext.get("type", "highlight"),
+                "annotationText": ext.get("annotatedText", ""),
+                "annotationComment": ext.get("comment", ""),
+                "annotationColor": ext.get("color", ""),
+                "parentItem": item_key,
+                "tags": [],
+                "_pdf_page": ext.get("page", 0),
+                "_from_pdf_extraction": True,
+                "_attachment_title": attachment.get("data", {}).get("title", "PDF")
+            }
+        }
+
+        # Handle image annotations; the image is checked now because the
+        # temporary directory is gone by the time annotations are rendered
+        if ext.get("type") == "image" and ext.get("imageRelativePath"):
+            image_path = os.path.join(att_dir, ext.get("imageRelativePath"))
+            pdf_anno["data"]["_image_path"] = image_path
+            pdf_anno["data"]["_has_image"] = os.path.exists(image_path)
+
+        pdf_annotations.append(pdf_anno)
+
+    return pdf_annotations
+
+
+def _search_annotations(zot, query_re: re.Pattern, limit: int, page_size: int = 100) -> list[dict]:
+    """
+    Find library annotations whose text or comment matches a pattern.
+
+    The web API's q parameter does not search annotation text, so annotations
+    are paged through and matched here, stopping once enough are found.
+
+    Args:
+        zot: Zotero client
+        query_re: Compiled pattern to look for
+        limit: Maximum number of matching annotations
+        page_size: Annotations fetched per request
+
+    Returns:
+        Matching Zotero annotation items, in library order
+    """
+    matches = []
+    start = 0
+    while len(matches) < limit:
+        page = zot.items(itemType="annotation", start=start, limit=page_size)
+        for anno in page:
+            data = anno.get("data", {})
+            if query_re.search(data.get("annotationText") or "") or query_re.search(data.get("annotationComment") or ""):
+                matches.append(anno)
+                if len(matches) >= limit:
+                    break
+        if len(page) < page_size:
+            break
+        start += page_size
+    return matches
+
+
+def _collect_annotations(
+    zot,
+    item_key: str | None,
+    parent: dict | None,
+    use_pdf_extraction: bool,
+    limit: int | None,
+    ctx: Context,
+    offset: int = 0
+) -> list[dict]:
+    """
+    Collect annotations for one item, or across the whole library.
+
+    For a single item, Better BibTeX is tried first (local Zotero only), then
+    the item's annotation children, then optionally direct PDF extraction.
+
+    Args:
+        zot: Zotero client
+        item_key: Parent item key, or None for library-wide retrieval
+        parent: The parent item when item_key is given
+        use_pdf_extraction: Whether to attempt direct PDF extraction as a fallback
+        limit: Maximum number of annotations for library-wide retrieval
+        ctx: MCP context
+        offset: Index of the first annotation for library-wide retrieval
+
+    Returns:
+        Zotero-like annotation dictionaries
+    """
+    if not item_key:
+        # Retrieve one page of annotations across the library
+        return zot.items(itemType="annotation", start=offset, limit=limit or 50)
+
+    # Initialize annotation sources
+    better_bibtex_annotations = []
+    zotero_api_annotations = []
+    pdf_annotations = []
+
+    # Try Better BibTeX method (local Zotero only)
+    if ZoteroBetterBibTexAPI is not None and os.environ.get("ZOTERO_LOCAL", "").lower() in ["true", "yes", "1"]:
+        try:
+            # Initialize Better BibTeX client
+            bibtex = ZoteroBetterBibTexAPI()
+
+            # Check if Zotero with Better BibTeX is running
+            if bibtex.is_zotero_running():
+                # Extract citation key
+                citation_key = None
+
+                # Try to find citation key in Extra field
+                try:
+                    citation_key = extract_citation_key(parent["data"].get("extra", ""))
+                except Exception as e:
+                    ctx.warning(f"Error extracting citation key from Extra field: {e}")
+
+                # Fallback to searching by title if no citation key found
+                if not citation_key:
+                    title = parent["data"].get("title", "")
+                    citation_key = _citekey_cache.get(title) if title else None
+                    try:
+                        if title and not citation_key:
+                            # Use the search_citekeys method
+                            search_results = bibtex.search_citekeys(title)
+
+                            # Find the matching item
+                            for result in search_results:
+                                ctx.info(f"Checking result: {result}")
+
+                                # Try to match with item key if possible
+                                if result.get('citekey'):
+                                    citation_key = result['citekey']
+                                    _citekey_cache.set(title, citation_key)
+                                    break
+                    except Exception as e:
+                        ctx.warning(f"Error searching for citation key: {e}")
+
+                # Process annotations if citation key found
+                if citation_key:
+                    try:
+                        # Determine library
+                        library = "*"  # Default all libraries
+                        search_results = bibtex.search_items(citation_key)
+                        if search_results:
+                            matched_item = next((item for item in search_results if item.get('citekey') == citation_key), None)
+                            if matched_item:
+                                library = matched_item.get('library', "*")
+
+                        # Get attachments
+                        attachments = bibtex.get_attachments(citation_key, library)
+
+                        # Process annotations from attachments
+                        for attachment in attachments:
+                            annotations = bibtex.get_annotations_from_attachment(attachment)
+
+                            for anno in annotations:
+                                processed = process_annotation(anno, attachment)
+                                if processed:
+                                    # Create Zotero-like annotation object
+                                    bibtex_anno = {
+                                        "key": processed.get("id", ""),
+                                        "data": {
+                                            "itemType": "annotation",
+                                            "annotationType": processed.get("type", "highlight"),
+                                            "annotationText": processed.get("annotatedText", ""),
+                                            "annotationComment": processed.get("comment", ""),
+                                            "annotationColor": processed.get("color", ""),
+                                            "parentItem": item_key,
+                                            "tags": [],
+                                            "_pdf_page": processed.get("page", 0),
+                                            "_pageLabel": processed.get("pageLabel", ""),
+                                            "_attachment_title": attachment.get("title", ""),
+                                            "_color_category": get_color_category(processed.get("color", "")),
+                                            "_from_better_bibtex": True
+                                        }
+                                    }
+                                    better_bibtex_annotations.append(bibtex_anno)
+
+                        ctx.info(f"Retrieved {len(better_bibtex_annotations)} annotations via Better BibTeX")
+                    except Exception as e:
+                        ctx.warning(f"Error processing Better BibTeX annotations: {e}")
+        except Exception as bibtex_error:
+            ctx.warning(f"Error initializing Better BibTeX: {bibtex_error}")
+
+    # Fallback to Zotero API annotations. The children are fetched once and
+    # split into annotations and PDF attachments for the PDF fallback below
+    pdf_attachments = None
+    if not better_bibtex_annotations:
+        try:
+            # Get child annotations via Zotero API
+            children = zot.children(item_key)
+            pdf_attachments = []
+            for item in children:
+                data = item.get("data", {})
+                if data.get("itemType") == "annotation":
+                    zotero_api_annotations.append(item)
+                elif data.get("contentType") == "application/pdf":
+                    pdf_attachments.append(item)
+            ctx.info(f"Retrieved {len(zotero_api_annotations)} annotations via Zotero API")
+        except Exception as api_error:
+            ctx.warning(f"Error retrieving Zotero API annotations: {api_error}")
+
+    # PDF Extraction fallback
+    if (
+        use_pdf_extraction
+        and extract_annotations_from_pdf is not None
+        and not (better_bibtex_annotations or zotero_api_annotations)
+    ):
+        try:
+            # Ensure PDF annotation tool is installed
+            if ensure_pdfannots_installed():
+                # Get PDF attachments, unless the children were already listed
+                if pdf_attachments is None:
+                    pdf_attachments = [
+                        item for item in zot.children(item_key)
+                        if item.get("data", {}).get("contentType") == "application/pdf"
+                    ]
+
+                # Download and extract all PDFs concurrently into one
+                # shared temporary directory
+                with tempfile.TemporaryDirectory() as tmpdir, ThreadPoolExecutor(
+                    max_workers=_PDF_EXTRACTION_WORKERS
+                ) as executor:
+                    for extracted in executor.map(
+                        lambda attachment: _extract_pdf_annotations(attachment, item_key, tmpdir),
+                        pdf_attachments,
+                    ):
+                        pdf_annotations.extend(extracted)
+
+                ctx.info(f"Retrieved {len(pdf_annotations)} annotations via PDF extraction")
+        except Exception as pdf_error:
+            ctx.warning(f"Error during PDF annotation extraction: {pdf_error}")
+
+    # Combine annotations from all sources
+    return better_bibtex_annotations + zotero_api_annotations + pdf_annotations
+
+
+def _annotation_color_category(data: dict) -> str:
+    """
+    Get the color category of an annotation.
+
+    Better BibTeX annotations carry one already; for others it is derived from
+    the annotation color when the Better BibTeX helpers are available.
+
+    Args:
+        data: The annotation's data dictionary
+
+    Returns:
+        The color category name, or "" if unknown
+    """
+    if category := data.get("_color_category"):
+        return category
+    color = data.get("annotationColor")
+    if not color or get_color_category is None:
+        return ""
+    return get_color_category(color)
+
+
+def _write_annotation(
+    w,
+    index: int,
+    anno: dict,
+    parent_titles: dict[str, str] | None = None,
+    heading: str = "##"
+) -> None:
+    """
+    Write one annotation as a markdown entry.
+
+    Args:
+        w: Write function of the output buffer
+        index: Position of the annotation in the listing (1-based)
+        anno: Zotero-like annotation dictionary
+        parent_titles: Parent titles by key, to name each annotation's parent;
+            None when all annotations share the parent named in the heading
+        heading: Markdown heading marker for the entry's title line
+    """
+    data = anno.get("data", {})
+
+    # Annotation details
+    anno_type = data.get("annotationType", "Unknown type")
+    anno_text = data.get("annotationText", "")
+    anno_comment = data.get("annotationComment", "")
+    anno_color = data.get("annotationColor", "")
+    anno_key = anno.get("key", "")
+
+    # Parent item context for library-wide retrieval
+    parent_info = ""
+    if parent_titles is not None and (parent_key := data.get("parentItem")):
+        if parent_key in parent_titles:
+            parent_info = f" (from \"{parent_titles[parent_key]}\")"
+        else:
+            parent_info = f" (parent key: {parent_key})"
+
+    # Annotation source details
+    source_info = ""
+    if data.get("_from_better_bibtex", False):
+        source_info = " (extracted via Better BibTeX)"
+    elif data.get("_from_pdf_extraction", False):
+        source_info = " (extracted directly from PDF)"
+
+    # Attachment context
+    attachment_info = ""
+    if "_attachment_title" in data and data["_attachment_title"]:
+        attachment_info = f" in {data['_attachment_title']}"
+
+    # Build markdown annotation entry
+    w(f"{heading} Annotation {index}{parent_info}{attachment_info}{source_info}\n")
+    w(f"**Type:** {anno_type}\n")
+    w(f"**Key:** {anno_key}\n")
+
+    # Color information
+    if anno_color:
+        w(f"**Color:** {anno_color}\n")
+        if category := _annotation_color_category(data):
+            w(f"**Color Category:** {category}\n")
+
+    # Page information
+    if "_pdf_page" in data:
+        label = data.get("_pageLabel", str(data["_pdf_page"]))
+        w(f"**Page:** {data['_pdf_page']} (Label: {label})\n")
+
+    # Annotation content
+    if anno_text:
+        w(f"**Text:** {anno_text}\n")
+
+    if anno_comment:
+        w(f"**Comment:** {anno_comment}\n")
+
+    # Image annotation
+    if data.get("_has_image"):
+        w("**Image:** This annotation includes an image (not displayed in this interface)\n")
+
+    # Tags
+    if tags := data.get("tags"):
+        w(f"**Tags:** {_format_tags(tags)}\n")
+
+    w("\n")  # Empty line between annotations
+
+
 @mcp.tool(
     name="zotero_get_annotations",
     description="Get all annotations for a specific item or across your entire Zotero library."
@@ -1083,6 +1863,7 @@ def get_annotations(
     item_key: str | None = None,
     use_pdf_extraction: bool = False,
     limit: int | str | None = None,
+    offset: int = 0,
     *,
     ctx: Context
 ) -> str:
@@ -1093,6 +1874,7 @@ def get_annotations(
         item_key: Optional Zotero item key/ID to filter annotations by parent item
         use_pdf_extraction: Whether to attempt direct PDF extraction as a fallback
         limit: Maximum number of annotations to return
+        offset: Number of annotations to skip when listing the whole library
         ctx: MCP context
 
     Returns:
@@ -1102,278 +1884,72 @@ def get_annotations(
         # Initialize Zotero client
         zot = get_zotero_client()
 
-        # Prepare annotations list
-        annotations = []
+        if isinstance(limit, str):
+            limit = int(limit)
+
+        parent = None
         parent_title = "Untitled Item"
 
         # If an item key is provided, use specialized retrieval
         if item_key:
             # First, verify the item exists and get its details
             try:
-                parent = zot.item(item_key)
+                parent = _get_item_sync(zot, item_key)
                 parent_title = parent["data"].get("title", "Untitled Item")
                 ctx.info(f"Fetching annotations for item: {parent_title}")
             except Exception:
                 return f"Error: No item found with key: {item_key}"
 
-            # Initialize annotation sources
-            better_bibtex_annotations = []
-            zotero_api_annotations = []
-            pdf_annotations = []
-
-            # Try Better BibTeX method (local Zotero only)
-            if os.environ.get("ZOTERO_LOCAL", "").lower() in ["true", "yes", "1"]:
-                try:
-                    # Import Better BibTeX dependencies
-                    from zotero_mcp.better_bibtex_client import (
-                        ZoteroBetterBibTexAPI,
-                        process_annotation,
-                        get_color_category
-                    )
-
-                    # Initialize Better BibTeX client
-                    bibtex = ZoteroBetterBibTexAPI()
-
-                    # Check if Zotero with Better BibTeX is running
-                    if bibtex.is_zotero_running():
-                        # Extract citation key
-                        citation_key = None
-
-                        # Try to find citation key in Extra field
-                        try:
-                            extra_field = parent["data"].get("extra", "")
-                            for line in extra_field.split("\n"):
-                                if line.lower().startswith("citation key:"):
-                                    citation_key = line.replace("Citation Key:", "").strip()
-                                    break
-                                elif line.lower().startswith("citationkey:"):
-                                    citation_key = line.replace("citationkey:", "").strip()
-                                    break
-                        except Exception as e:
-                            ctx.warn(f"Error extracting citation key from Extra field: {e}")
-
-                        # Fallback to searching by title if no citation key found
-                        if not citation_key:
-                            title = parent["data"].get("title", "")
-                            try:
-                                if title:
-                                    # Use the search_citekeys method
-                                    search_results = bibtex.search_citekeys(title)
-
-                                    # Find the matching item
-                                    for result in search_results:
-                                        ctx.info(f"Checking result: {result}")
-
-                                        # Try to match with item key if possible
-                                        if result.get('citekey'):
-                                            citation_key = result['citekey']
-                                            break
-                            except Exception as e:
-                                ctx.warn(f"Error searching for citation key: {e}")
-
-                        # Process annotations if citation key found
-                        if citation_key:
-                            try:
-                                # Determine library
-                                library = "*"  # Default all libraries
-                                search_results = bibtex._make_request("item.search", [citation_key])
-                                if search_results:
-                                    matched_item = next((item for item in search_results if item.get('citekey') == citation_key), None)
-                                    if matched_item:
-                                        library = matched_item.get('library', "*")
-
-                                # Get attachments
-                                attachments = bibtex.get_attachments(citation_key, library)
-
-                                # Process annotations from attachments
-                                for attachment in attachments:
-                                    annotations = bibtex.get_annotations_from_attachment(attachment)
-
-                                    for anno in annotations:
-                                        processed = process_annotation(anno, attachment)
-                                        if processed:
-                                            # Create Zotero-like annotation object
-                                            bibtex_anno = {
-                                                "key": processed.get("id", ""),
-                                                "data": {
-                                                    "itemType": "annotation",
-                                                    "annotationType": processed.get("type", "highlight"),
-                                                    "annotationText": processed.get("annotatedText", ""),
-                                                    "annotationComment": processed.get("comment", ""),
-                                                    "annotationColor": processed.get("color", ""),
-                                                    "parentItem": item_key,
-                                                    "tags": [],
-                                                    "_pdf_page": processed.get("page", 0),
-                                                    "_pageLabel": processed.get("pageLabel", ""),
-                                                    "_attachment_title": attachment.get("title", ""),
-                                                    "_color_category": get_color_category(processed.get("color", "")),
-                                                    "_from_better_bibtex": True
-                                                }
-                                            }
-                                            better_bibtex_annotations.append(bibtex_anno)
-
-                                ctx.info(f"Retrieved {len(better_bibtex_annotations)} annotations via Better BibTeX")
-                            except Exception as e:
-                                ctx.warn(f"Error processing Better BibTeX annotations: {e}")
-                except Exception as bibtex_error:
-                    ctx.warn(f"Error initializing Better BibTeX: {bibtex_error}")
-
-            # Fallback to Zotero API annotations
-            if not better_bibtex_annotations:
-                try:
-                    # Get child annotations via Zotero API
-                    children = zot.children(item_key)
-                    zotero_api_annotations = [
-                        item for item in children
-                        if item.get("data", {}).get("itemType") == "annotation"
-                    ]
-                    ctx.info(f"Retrieved {len(zotero_api_annotations)} annotations via Zotero API")
-                except Exception as api_error:
-                    ctx.warn(f"Error retrieving Zotero API annotations: {api_error}")
-
-            # PDF Extraction fallback
-            if use_pdf_extraction and not (better_bibtex_annotations or zotero_api_annotations):
-                try:
-                    from zotero_mcp.pdfannots_helper import extract_annotations_from_pdf, ensure_pdfannots_installed
-                    import tempfile
-                    import uuid
-
-                    # Ensure PDF annotation tool is installed
-                    if ensure_pdfannots_installed():
-                        # Get PDF attachments
-                        children = zot.children(item_key)
-                        pdf_attachments = [
-                            item for item in children
-                            if item.get("data", {}).get("contentType") == "application/pdf"
-                        ]
-
-                        # Extract annotations from PDFs
-                        for attachment in pdf_attachments:
-                            with tempfile.TemporaryDirectory() as tmpdir:
-                                att_key = attachment.get("key", "")
-                                file_path = os.path.join(tmpdir, f"{att_key}.pdf")
-                                zot.dump(att_key, file_path)
-
-                                if os.path.exists(file_path):
-                                    extracted = extract_annotations_from_pdf(file_path, tmpdir)
-
-                                    for ext in extracted:
-                                        # Skip empty annotations
-                                        if not ext.get("annotatedText") and not ext.get("comment"):
-                                            continue
-
-                                        # Create Zotero-like annotation object
-                                        pdf_anno = {
-                                            "key": f"pdf_{att_key}_{ext.get('id', uuid.uuid4().hex[:8])}",
-                                            "data": {
-                                                "itemType": "annotation",
-                                                "annotationType": ext.get("type", "highlight"),
-                                                "annotationText": ext.get("annotatedText", ""),
-                                                "annotationComment": ext.get("comment", ""),
-                                                "annotationColor": ext.get("color", ""),
-                                                "parentItem": item_key,
-                                                "tags": [],
-                                                "_pdf_page": ext.get("page", 0),
-                                                "_from_pdf_extraction": True,
-                                                "_attachment_title": attachment.get("data", {}).get("title", "PDF")
-                                            }
-                                        }
-
-                                        # Handle image annotations
-                                        if ext.get("type") == "image" and ext.get("imageRelativePath"):
-                                            pdf_anno["data"]["_image_path"] = os.path.join(tmpdir, ext.get("imageRelativePath"))
-
-                                        pdf_annotations.append(pdf_anno)
-
-                        ctx.info(f"Retrieved {len(pdf_annotations)} annotations via PDF extraction")
-                except Exception as pdf_error:
-                    ctx.warn(f"Error during PDF annotation extraction: {pdf_error}")
-
-            # Combine annotations from all sources
-            annotations = better_bibtex_annotations + zotero_api_annotations + pdf_annotations
-
-        else:
-            # Retrieve all annotations in the library
-            if isinstance(limit, str):
-                limit = int(limit)
-            zot.add_parameters(itemType="annotation", limit=limit or 50)
-            annotations = zot.everything(zot.items())
+        annotations = _collect_annotations(
+            zot, item_key, parent, use_pdf_extraction, limit, ctx, offset=offset
+        )
 
         # Handle no annotations found
         if not annotations:
             return f"No annotations found{f' for item: {parent_title}' if item_key else ''}."
 
-        # Generate markdown output
-        output = [f"# Annotations{f' for: {parent_title}' if item_key else ''}", ""]
+        # Resolve parent titles for library-wide retrieval in bulk
+        parent_titles = None if item_key else _parent_titles(zot, annotations)
 
-        for i, anno in enumerate(annotations, 1):
-            data = anno.get("data", {})
-
-            # Annotation details
-            anno_type = data.get("annotationType", "Unknown type")
-            anno_text = data.get("annotationText", "")
-            anno_comment = data.get("annotationComment", "")
-            anno_color = data.get("annotationColor", "")
-            anno_key = anno.get("key", "")
-
-            # Parent item context for library-wide retrieval
-            parent_info = ""
-            if not item_key and (parent_key := data.get("parentItem")):
-                try:
-                    parent = zot.item(parent_key)
-                    parent_title = parent["data"].get("title", "Untitled")
-                    parent_info = f" (from \"{parent_title}\")"
-                except Exception:
-                    parent_info = f" (parent key: {parent_key})"
-
-            # Annotation source details
-            source_info = ""
-            if data.get("_from_better_bibtex", False):
-                source_info = " (extracted via Better BibTeX)"
-            elif data.get("_from_pdf_extraction", False):
-                source_info = " (extracted directly from PDF)"
-
-            # Attachment context
-            attachment_info = ""
-            if "_attachment_title" in data and data["_attachment_title"]:
-                attachment_info = f" in {data['_attachment_title']}"
-
-            # Build markdown annotation entry
-            output.append(f"## Annotation {i}{parent_info}{attachment_info}{source_info}")
-            output.append(f"**Type:** {anno_type}")
-            output.append(f"**Key:** {anno_key}")
-
-            # Color information
-            if anno_color:
-                output.append(f"**Color:** {anno_color}")
-                if "_color_category" in data and data["_color_category"]:
-                    output.append(f"**Color Category:** {data['_color_category']}")
-
-            # Page information
-            if "_pdf_page" in data:
-                label = data.get("_pageLabel", str(data["_pdf_page"]))
-                output.append(f"**Page:** {data['_pdf_page']} (Label: {label})")
-
-            # Annotation content
-            if anno_text:
-                output.append(f"**Text:** {anno_text}")
-
-            if anno_comment:
-                output.append(f"**Comment:** {anno_comment}")
-
-            # Image annotation
-            if "_image_path" in data and os.path.exists(data["_image_path"]):
-                output.append("**Image:** This annotation includes an image (not displayed in this interface)")
-
-            # Tags
-            if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
-
-            output.append("")  # Empty line between annotations
-
-        return "\n".join(output)
+        # Generate markdown output
+        buf = io.StringIO()
+        w = buf.write
+        w(f"# Annotations{f' for: {parent_title}' if item_key else ''}\n\n")
+
+        # Group annotations by color category in one pass
+        groups = defaultdict(list)
+        for anno in annotations:
+            groups[_annotation_color_category(anno.get("data", {}))].append(anno)
+
+        start = offset + 1 if not item_key else 1
+        if list(groups) == [""]:
+            # No color information at all; list the annotations as they are
+            for i, anno in enumerate(annotations, start):
+                _write_annotation(w, i, anno, parent_titles)
+        else:
+            # Largest groups first, annotations without a category last
+            ordered = sorted(groups.items(), key=lambda group: (not group[0], -len(group[1])))
+
+            w("**Color Categories:**\n")
+            w("\n")
+            w("| Category | Count |\n")
+            w("| --- | --- |\n")
+            for category, items in ordered:
+                w(f"| {category or 'Uncategorized'} | {len(items)} |\n")
+            w("\n")
+
+            i = start
+            for category, items in ordered:
+                w(f"## Color: {category or 'Uncategorized'} ({len(items)})\n\n")
+                for anno in items:
+                    _write_annotation(w, i, anno, parent_titles, heading="###")
+                    i += 1
+
+        # A full page suggests there are more annotations to list
+        if not item_key and len(annotations) >= (limit or 50):
+            w(f"_Next offset: {offset + len(annotations)}_\n")
+
+        return buf.getvalue()
 
     except Exception as e:
         ctx.error(f"Error fetching annotations: {str(e)}")
@@ -1424,7 +2000,10 @@ def get_notes(
             return f"No notes found{f' for item {item_key}' if item_key else ''}."
 
         # Generate markdown output
-        output = [f"# Notes{f' for Item: {item_key}' if item_key else ''}", ""]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"# Notes{f' for Item: {item_key}' if item_key else ''}\n\n")
+        parent_titles = _parent_titles(zot, notes)
 
         for i, note in enumerate(notes, 1):
             data = note.get("data", {})
@@ -1433,11 +2012,9 @@ def get_notes(
             # Parent item context
             parent_info = ""
             if parent_key := data.get("parentItem"):
-                try:
-                    parent = zot.item(parent_key)
-                    parent_title = parent["data"].get("title", "Untitled")
-                    parent_info = f" (from \"{parent_title}\")"
-                except Exception:
+                if parent_key in parent_titles:
+                    parent_info = f" (from \"{parent_titles[parent_key]}\")"
+                else:
                     parent_info = f" (parent key: {parent_key})"
 
             # Prepare note text
@@ -1451,19 +2028,17 @@ def get_notes(
                 note_text = note_text[:500] + "..."
 
             # Build markdown entry
-            output.append(f"## Note {i}{parent_info}")
-            output.append(f"**Key:** {note_key}")
+            w(f"## Note {i}{parent_info}\n")
+            w(f"**Key:** {note_key}\n")
 
             # Tags
             if tags := data.get("tags"):
-                tag_list = [f"`{tag['tag']}`" for tag in tags]
-                if tag_list:
-                    output.append(f"**Tags:** {' '.join(tag_list)}")
+                w(f"**Tags:** {_format_tags(tags)}\n")
 
-            output.append(f"**Content:**\n{note_text}")
-            output.append("")  # Empty line between notes
+            w(f"**Content:**\n{note_text}\n")
+            w("\n")  # Empty line between notes
 
-        return "\n".join(output)
+        return buf.getvalue()
 
     except Exception as e:
         ctx.error(f"Error fetching notes: {str(e)}")
@@ -1503,61 +2078,31 @@ def search_notes(
         if isinstance(limit, str):
             limit = int(limit)
 
-        # First search notes
-        zot.add_parameters(q=query, itemType="note", limit=limit or 20)
-        notes = zot.items()
-
-        # Then search annotations (reusing the get_annotations function)
-        annotation_results = get_annotations(
-            item_key=None,  # Search all annotations
-            use_pdf_extraction=True,
-            limit=limit or 20,
-            ctx=ctx
-        )
-
-        # Parse the annotation results to extract annotation items
-        # This is a bit hacky and depends on the exact formatting of get_annotations
-        # You might want to modify get_annotations to return a more structured result
-        annotation_lines = annotation_results.split("\n")
-        current_annotation = None
-        annotations = []
-
-        for line in annotation_lines:
-            if line.startswith("## "):
-                if current_annotation:
-                    annotations.append(current_annotation)
-                current_annotation = {"lines": [line], "type": "annotation"}
-            elif current_annotation is not None:
-                current_annotation["lines"].append(line)
+        # First search notes; "everything" mode makes Zotero match note bodies
+        notes = zot.items(q=query, qmode="everything", itemType="note", limit=limit or 20)
 
-        if current_annotation:
-            annotations.append(current_annotation)
+        # Then search annotations library-wide; PDF extraction only applies
+        # to a single item, so it is not attempted here
+        query_re = re.compile(re.escape(query), re.IGNORECASE)
+        annotations = _search_annotations(zot, query_re, limit or 20)
 
         # Format results
-        output = [f"# Search Results for '{query}'", ""]
-
-        # Filter and highlight notes
-        query_lower = query.lower()
-        note_results = []
+        buf = io.StringIO()
+        w = buf.write
+        w(f"# Search Results for '{query}'\n\n")
 
-        for note in notes:
-            data = note.get("data", {})
-            note_text = data.get("note", "").lower()
-
-            if query_lower in note_text:
-                # Prepare full note details
-                note_result = {
-                    "type": "note",
-                    "key": note.get("key", ""),
-                    "data": data
-                }
-                note_results.append(note_result)
+        # Zotero already matched the query against the notes
+        note_results = [
+            {"type": "note", "key": note.get("key", ""), "data": note.get("data", {})}
+            for note in notes
+        ]
 
         # Combine and sort results
         all_results = note_results + annotations
+        parent_titles = _parent_titles(zot, all_results)
 
         for i, result in enumerate(all_results, 1):
-            if result["type"] == "note":
+            if result.get("type") == "note":
                 # Note formatting
                 data = result["data"]
                 key = result["key"]
@@ -1565,58 +2110,50 @@ def search_notes(
                 # Parent item context
                 parent_info = ""
                 if parent_key := data.get("parentItem"):
-                    try:
-                        parent = zot.item(parent_key)
-                        parent_title = parent["data"].get("title", "Untitled")
-                        parent_info = f" (from \"{parent_title}\")"
-                    except Exception:
+                    if parent_key in parent_titles:
+                        parent_info = f" (from \"{parent_titles[parent_key]}\")"
+                    else:
                         parent_info = f" (parent key: {parent_key})"
 
                 # Note text with query highlight
-                note_text = data.get("note", "")
-                note_text = note_text.replace("<p>", "").replace("</p>", "\n\n")
-                note_text = note_text.replace("<br/>", "\n").replace("<br>", "\n")
+                note_text = _NOTE_HTML_RE.sub(_note_html_replacement, data.get("note", ""))
 
                 # Highlight query in note text
                 try:
                     # Find first occurrence of query and extract context
-                    text_lower = note_text.lower()
-                    pos = text_lower.find(query_lower)
-                    if pos >= 0:
-                        # Extract context around the query
+                    match = query_re.search(note_text)
+                    if match:
+                        # Extract context around the query and highlight the match,
+                        # whose position is already known
+                        pos, match_end = match.span()
                         start = max(0, pos - 100)
                         end = min(len(note_text), pos + 200)
-                        context = note_text[start:end]
-
-                        # Highlight the query in the context
-                        highlighted = context.replace(
-                            context[context.lower().find(query_lower):context.lower().find(query_lower)+len(query)],
-                            f"**{context[context.lower().find(query_lower):context.lower().find(query_lower)+len(query)]}**"
+                        note_text = (
+                            f"{note_text[start:pos]}**{note_text[pos:match_end]}**"
+                            f"{note_text[match_end:end]}..."
                         )
-
-                        note_text = highlighted + "..."
+                    else:
+                        # Zotero matched text we can't locate here (tags,
+                        # entities, markup); show the start of the note
+                        note_text = note_text[:500] + "..."
                 except Exception:
                     # Fallback to first 500 characters if highlighting fails
                     note_text = note_text[:500] + "..."
 
-                output.append(f"## Note {i}{parent_info}")
-                output.append(f"**Key:** {key}")
+                w(f"## Note {i}{parent_info}\n")
+                w(f"**Key:** {key}\n")
 
                 # Tags
                 if tags := data.get("tags"):
-                    tag_list = [f"`{tag['tag']}`" for tag in tags]
-                    if tag_list:
-                        output.append(f"**Tags:** {' '.join(tag_list)}")
+                    w(f"**Tags:** {_format_tags(tags)}\n")
 
-                output.append(f"**Content:**\n{note_text}")
-                output.append("")
+                w(f"**Content:**\n{note_text}\n")
+                w("\n")
 
-            elif result["type"] == "annotation":
-                # Add the entire annotation block
-                output.extend(result["lines"])
-                output.append("")
+            else:
+                _write_annotation(w, i, result, parent_titles)
 
-        return "\n".join(output) if output else f"No results found for '{query}'"
+        return buf.getvalue()
 
     except Exception as e:
         ctx.error(f"Error searching notes: {str(e)}")
@@ -1654,7 +2191,7 @@ def create_note(
 
         # First verify the parent item exists
         try:
-            parent = zot.item(item_key)
+            parent = _get_item_sync(zot, item_key)
             parent_title = parent["data"].get("title", "Untitled Item")
         except Exception:
             return f"Error: No item found with key: {item_key}"
@@ -1664,14 +2201,12 @@ def create_note(
         if "<p>" in note_text or "<div>" in note_text:
             html_content = note_text
         else:
-            # Convert plain text to HTML paragraphs - avoiding f-strings with replacements
-            paragraphs = note_text.split("\n\n")
-            html_parts = []
-            for p in paragraphs:
-                # Replace newlines with <br/> tags
-                p_with_br = p.replace("\n", "<br/>")
-                html_parts.append("<p>" + p_with_br + "</p>")
-            html_content = "".join(html_parts)
+            # Convert plain text to HTML paragraphs, with <br/> for single newlines
+            html_content = (
+                "<p>"
+                + note_text.replace("\n\n", "</p><p>").replace("\n", "<br/>")
+                + "</p>"
+            )
 
         # Prepare the note data
         note_data = {
@@ -1684,6 +2219,11 @@ def create_note(
         # Create the note
         result = zot.create_items([note_data])
 
+        # The parent's child count (and possibly the tag list) changed
+        _item_cache.pop(item_key)
+        if tags:
+            _tags_cache.clear()
+
         # Check if creation was successful
         if "success" in result and result["success"]:
             successful = result["success"]
@@ -1732,7 +2272,7 @@ def semantic_search(
             # Handle JSON string input
             if isinstance(filters, str):
                 try:
-                    filters = json.loads(filters)
+                    filters = json_loads(filters)
                     ctx.info(f"Parsed JSON string filters: {filters}")
                 except json.JSONDecodeError as e:
                     return f"Error: Invalid JSON in filters parameter: {str(e)}"
@@ -1752,18 +2292,8 @@ def semantic_search(
 
         ctx.info(f"Performing semantic search for: '{query}'")
 
-        # Import semantic search module
-        from zotero_mcp.semantic_search import create_semantic_search
-        from pathlib import Path
-
-        # Determine config path
-        config_path = Path.home() / ".config" / "zotero-mcp" / "config.json"
-
-        # Create semantic search instance
-        search = create_semantic_search(str(config_path))
-
-        # Perform search
-        results = search.search(query=query, limit=limit, filters=filters)
+        # Perform search (identical queries are served from the cache)
+        results = _cached_search(query, limit, _filters_key(filters))
 
         if results.get("error"):
             return f"Semantic search error: {results['error']}"
@@ -1773,61 +2303,51 @@ def semantic_search(
         if not search_results:
             return f"No semantically similar items found for query: '{query}'"
 
-        # Format results as markdown
-        output = [f"# Semantic Search Results for '{query}'", ""]
-        output.append(f"Found {len(search_results)} similar items:")
-        output.append("")
+        # Format results as markdown, one block per result
+        output = [
+            f"# Semantic Search Results for '{query}'\n\n"
+            f"Found {len(search_results)} similar items:\n"
+        ]
 
         for i, result in enumerate(search_results, 1):
             similarity_score = result.get("similarity_score", 0)
-            _ = result.get("metadata", {})
             zotero_item = result.get("zotero_item", {})
 
             if zotero_item:
                 data = zotero_item.get("data", {})
-                title = data.get("title", "Untitled")
-                item_type = data.get("itemType", "unknown")
                 key = result.get("item_key", "")
-
-                # Format creators
-                creators = data.get("creators", [])
-                creators_str = format_creators(creators)
-
-                output.append(f"## {i}. {title}")
-                output.append(f"**Similarity Score:** {similarity_score:.3f}")
-                output.append(f"**Type:** {item_type}")
-                output.append(f"**Item Key:** {key}")
-                output.append(f"**Authors:** {creators_str}")
-
-                # Add date if available
-                if date := data.get("date"):
-                    output.append(f"**Date:** {date}")
-
-                # Add abstract snippet if present
-                if abstract := data.get("abstractNote"):
-                    abstract_snippet = abstract[:200] + "..." if len(abstract) > 200 else abstract
-                    output.append(f"**Abstract:** {abstract_snippet}")
-
-                # Add tags if present
-                if tags := data.get("tags"):
-                    tag_list = [f"`{tag['tag']}`" for tag in tags]
-                    if tag_list:
-                        output.append(f"**Tags:** {' '.join(tag_list)}")
-
-                # Show matched text snippet
+                date = data.get("date")
+                abstract = data.get("abstractNote", "")
+                tags = _format_tags(data.get("tags") or ())
                 matched_text = result.get("matched_text", "")
-                if matched_text:
-                    snippet = matched_text[:300] + "..." if len(matched_text) > 300 else matched_text
-                    output.append(f"**Matched Content:** {snippet}")
 
-                output.append("")  # Empty line between items
+                extras = []
+                if date:
+                    extras.append(f"**Date:** {date}\n")
+                if abstract:
+                    extras.append(f"**Abstract:** {abstract[:200] + '...' if len(abstract) > 200 else abstract}\n")
+                if tags:
+                    extras.append(f"**Tags:** {tags}\n")
+                if matched_text:
+                    extras.append(f"**Matched Content:** {matched_text[:300] + '...' if len(matched_text) > 300 else matched_text}\n")
+
+                output.append(_semantic_result_block(
+                    index=i,
+                    title=data.get("title", "Untitled"),
+                    score=similarity_score,
+                    item_type=data.get("itemType", "unknown"),
+                    key=key,
+                    authors=format_creators(data.get("creators", [])),
+                    extras="".join(extras),
+                ))
             else:
                 # Fallback if full Zotero item not available
-                output.append(f"## {i}. Item {result.get('item_key', 'Unknown')}")
-                output.append(f"**Similarity Score:** {similarity_score:.3f}")
-                if error := result.get("error"):
-                    output.append(f"**Error:** {error}")
-                output.append("")
+                error = result.get("error")
+                output.append(
+                    f"## {i}. Item {result.get('item_key', 'Unknown')}\n"
+                    f"**Similarity Score:** {similarity_score:.3f}\n"
+                    + (f"**Error:** {error}\n" if error else "")
+                )
 
         return "\n".join(output)
 
@@ -1860,15 +2380,8 @@ def update_search_database(
     try:
         ctx.info("Starting semantic search database update...")
 
-        # Import semantic search module
-        from zotero_mcp.semantic_search import create_semantic_search
-        from pathlib import Path
-
-        # Determine config path
-        config_path = Path.home() / ".config" / "zotero-mcp" / "config.json"
-
-        # Create semantic search instance
-        search = create_semantic_search(str(config_path))
+        # Get the shared semantic search instance
+        search = _get_search(str(_CONFIG_PATH))
 
         # Perform update with no fulltext extraction (for speed)
         stats = search.update_database(
@@ -1877,24 +2390,29 @@ def update_search_database(
             extract_fulltext=False
         )
 
-        # Format results
-        output = ["# Database Update Results", ""]
+        # The index changed, so cached query results are stale
+        _search_results_cache.clear()
 
         if stats.get("error"):
-            output.append(f"**Error:** {stats['error']}")
-        else:
-            output.append(f"**Total items:** {stats.get('total_items', 0)}")
-            output.append(f"**Processed:** {stats.get('processed_items', 0)}")
-            output.append(f"**Added:** {stats.get('added_items', 0)}")
-            output.append(f"**Updated:** {stats.get('updated_items', 0)}")
-            output.append(f"**Skipped:** {stats.get('skipped_items', 0)}")
-            output.append(f"**Errors:** {stats.get('errors', 0)}")
-            output.append(f"**Duration:** {stats.get('duration', 'Unknown')}")
-
-            if stats.get('start_time'):
-                output.append(f"**Started:** {stats['start_time']}")
-            if stats.get('end_time'):
-                output.append(f"**Completed:** {stats['end_time']}")
+            return f"# Database Update Results\n\n**Error:** {stats['error']}"
+
+        # Format results
+        output = [
+            "# Database Update Results",
+            "",
+            f"**Total items:** {stats.get('total_items', 0)}",
+            f"**Processed:** {stats.get('processed_items', 0)}",
+            f"**Added:** {stats.get('added_items', 0)}",
+            f"**Updated:** {stats.get('updated_items', 0)}",
+            f"**Skipped:** {stats.get('skipped_items', 0)}",
+            f"**Errors:** {stats.get('errors', 0)}",
+            f"**Duration:** {stats.get('duration', 'Unknown')}",
+        ]
+
+        if stats.get('start_time'):
+            output.append(f"**Started:** {stats['start_time']}")
+        if stats.get('end_time'):
+            output.append(f"**Completed:** {stats['end_time']}")
 
         return "\n".join(output)
 
@@ -1920,15 +2438,8 @@ def get_search_database_status(*, ctx: Context) -> str:
     try:
         ctx.info("Getting semantic search database status...")
 
-        # Import semantic search module
-        from zotero_mcp.semantic_search import create_semantic_search
-        from pathlib import Path
-
-        # Determine config path
-        config_path = Path.home() / ".config" / "zotero-mcp" / "config.json"
-
-        # Create semantic search instance
-        search = create_semantic_search(str(config_path))
+        # Get the shared semantic search instance
+        search = _get_search(str(_CONFIG_PATH))
 
         # Get status
         status = search.get_database_status()
@@ -1970,6 +2481,40 @@ def get_search_database_status(*, ctx: Context) -> str:
 # specific tools required are "search" and "fetch"
 # See: https://platform.openai.com/docs/mcp
 
+# Common patterns:
+# - zotero://select/items/<KEY>
+# - zotero://select/library/items/<KEY>
+# - https://www.zotero.org/.../items/<KEY>
+# - bare <KEY>
+_KEY_PATTERNS = (
+    re.compile(r"zotero://select/(?:library/)?items/([A-Za-z0-9]{8})"),
+    re.compile(r"/items/([A-Za-z0-9]{8})(?:[^A-Za-z0-9]|$)"),
+    re.compile(r"\b([A-Za-z0-9]{8})\b"),
+)
+
+
+@lru_cache(maxsize=1)
+def _web_url_prefix() -> str:
+    """
+    Get the zotero.org items URL prefix for the configured library.
+
+    Resolved on first use rather than at import time, because the CLI applies
+    environment settings from its config file after importing this module.
+
+    Returns:
+        The URL prefix ending in "/items/", or "" if no library ID is set
+    """
+    lib_type = (os.getenv("ZOTERO_LIBRARY_TYPE", "user") or "user").lower()
+    lib_id = os.getenv("ZOTERO_LIBRARY_ID", "")
+    if not lib_id:
+        return ""
+    lib_path = "groups" if lib_type == "group" else "users"
+    return f"https://www.zotero.org/{lib_path}/{lib_id}/items/"
+
+# Everything after the "## Full Text" heading of get_item_fulltext output
+_FULLTEXT_RE = re.compile(r"## Full Text[\n #]*(.*)", re.S)
+
+
 def _extract_item_key_from_input(value: str) -> str | None:
     """Extract a Zotero item key from a Zotero URL, web URL, or bare key.
     Returns None if no plausible key is found.
@@ -1978,19 +2523,8 @@ def _extract_item_key_from_input(value: str) -> str | None:
         return None
     text = value.strip()
 
-    # Common patterns:
-    # - zotero://select/items/<KEY>
-    # - zotero://select/library/items/<KEY>
-    # - https://www.zotero.org/.../items/<KEY>
-    # - bare <KEY>
-    patterns = [
-        r"zotero://select/(?:library/)?items/([A-Za-z0-9]{8})",
-        r"/items/([A-Za-z0-9]{8})(?:[^A-Za-z0-9]|$)",
-        r"\b([A-Za-z0-9]{8})\b",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, text)
+    for pattern in _KEY_PATTERNS:
+        match = pattern.search(text)
         if match:
             return match.group(1)
     return None
@@ -1999,7 +2533,7 @@ def _extract_item_key_from_input(value: str) -> str | None:
     name="search",
     description="ChatGPT-compatible search wrapper. Performs semantic search and returns JSON results."
 )
-def chatgpt_connector_search(
+async def chatgpt_connector_search(
     query: str,
     *,
     ctx: Context
@@ -2011,39 +2545,39 @@ def chatgpt_connector_search(
     try:
         default_limit = 10
 
-        from zotero_mcp.semantic_search import create_semantic_search
-
-        config_path = Path.home() / ".config" / "zotero-mcp" / "config.json"
-        search = create_semantic_search(str(config_path))
-
-        result_list: list[dict[str, str]] = []
-        results = search.search(query=query, limit=default_limit, filters=None) or {}
+        result_list: list[dict] = []
+        results = await asyncio.to_thread(
+            _cached_search, query, default_limit, _filters_key(None)
+        ) or {}
         for r in results.get("results", []):
             item_key = r.get("item_key") or ""
             title = ""
             if r.get("zotero_item"):
                 data = (r.get("zotero_item") or {}).get("data", {})
                 title = data.get("title", "")
+            if not title:
+                # The index stores the title too, so no extra API call is needed
+                title = (r.get("metadata") or {}).get("title", "")
             if not title:
                 title = f"Zotero Item {item_key}" if item_key else "Zotero Item"
             url = f"zotero://select/items/{item_key}" if item_key else ""
             result_list.append({
                 "id": item_key or uuid.uuid4().hex[:8],
-                "title": title,
+                "title": str(title),
                 "url": url,
             })
 
-        return json.dumps({"results": result_list}, separators=(",", ":"))
+        return json_dumps({"results": result_list})
     except Exception as e:
-        ctx.error(f"Error in search wrapper: {str(e)}")
-        return json.dumps({"results": []}, separators=(",", ":"))
+        await ctx.error(f"Error in search wrapper: {str(e)}")
+        return json_dumps({"results": []})
 
 
 @mcp.tool(
     name="fetch",
     description="ChatGPT-compatible fetch wrapper. Retrieves fulltext/metadata for a Zotero item by ID."
 )
-def connector_fetch(
+async def connector_fetch(
     id: str,
     *,
     ctx: Context
@@ -2055,49 +2589,37 @@ def connector_fetch(
     try:
         item_key = (id or "").strip()
         if not item_key:
-            return json.dumps({
+            return json_dumps({
                 "id": id,
                 "title": "",
                 "text": "",
                 "url": "",
                 "metadata": {"error": "missing item key"}
-            }, separators=(",", ":"))
+            })
 
-        # Fetch item metadata for title and context
-        zot = get_zotero_client()
+        # Fetch item metadata (for title and context) first, so the fulltext
+        # tool that follows finds the item in the cache
         try:
-            item = zot.item(item_key)
-            data = item.get("data", {}) if item else {}
+            item = await _get_item(item_key)
         except Exception:
             item = None
-            data = {}
+        text_md = await get_item_fulltext(item_key=item_key, max_inline_chars=None, ctx=ctx)
+        data = item.get("data", {}) if item else {}
+        authors_str = format_creators(data.get("creators", []))
 
         title = data.get("title", f"Zotero Item {item_key}")
         zotero_url = f"zotero://select/items/{item_key}"
         # Prefer web URL for connectors; fall back to zotero:// if unknown
-        lib_type = (os.getenv("ZOTERO_LIBRARY_TYPE", "user") or "user").lower()
-        lib_id = os.getenv("ZOTERO_LIBRARY_ID", "")
-        if lib_type not in ["user", "group"]:
-            lib_type = "user"
-        web_url = f"https://www.zotero.org/{'users' if lib_type=='user' else 'groups'}/{lib_id}/items/{item_key}" if lib_id else ""
+        web_prefix = _web_url_prefix()
+        web_url = web_prefix + item_key if web_prefix else ""
         url = web_url or zotero_url
 
-        # Use existing tool to get best-effort fulltext/markdown
-        text_md = get_item_fulltext(item_key=item_key, ctx=ctx)
         # Extract the actual full text section if present, else keep as-is
-        text_clean = text_md
-        try:
-            marker = "## Full Text"
-            pos = text_md.find(marker)
-            if pos >= 0:
-                text_clean = text_md[pos + len(marker):].lstrip("\n #")
-        except Exception:
-            pass
+        match = _FULLTEXT_RE.search(text_md)
+        text_clean = match.group(1) if match else text_md
         if (not text_clean or len(text_clean.strip()) < 40) and data:
             abstract = data.get("abstractNote", "")
-            creators = data.get("creators", [])
-            byline = format_creators(creators)
-            text_clean = (f"{title}\n\n" + (f"Authors: {byline}\n" if byline else "") +
+            text_clean = (f"{title}\n\n" + (f"Authors: {authors_str}\n" if authors_str else "") +
                           (f"Abstract:\n{abstract}" if abstract else "")) or text_md
 
         metadata = {
@@ -2105,26 +2627,26 @@ def connector_fetch(
             "date": data.get("date", ""),
             "key": item_key,
             "doi": data.get("DOI", ""),
-            "authors": format_creators(data.get("creators", [])),
+            "authors": authors_str,
             "tags": [t.get("tag", "") for t in (data.get("tags", []) or [])],
             "zotero_url": zotero_url,
             "web_url": web_url,
             "source": "zotero-mcp"
         }
 
-        return json.dumps({
+        return json_dumps({
             "id": item_key,
             "title": title,
             "text": text_clean,
             "url": url,
             "metadata": metadata
-        }, separators=(",", ":"))
+        })
     except Exception as e:
-        ctx.error(f"Error in fetch wrapper: {str(e)}")
-        return json.dumps({
+        await ctx.error(f"Error in fetch wrapper: {str(e)}")
+        return json_dumps({
             "id": id,
             "title": "",
             "text": "",
             "url": "",
             "metadata": {"error": str(e)}
-        }, separators=(",", ":"))
+        })
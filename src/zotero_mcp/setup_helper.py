@@ -7,68 +7,192 @@ This script provides utilities to automatically configure zotero-mcp
 by finding the installed executable and updating Claude Desktop's config.
 """
 
-import argparse
-import getpass
+import glob
+import hashlib
 import json
 import os
-import shutil
+import stat
 import sys
+import sysconfig
+import tempfile
 from pathlib import Path
+from types import MappingProxyType
+
+from zotero_mcp.utils import json_dumps, json_loads
+
+# Process-invariant platform and location values
+_PLATFORM = sys.platform
+_EXE_NAME = "zotero-mcp.exe" if _PLATFORM == "win32" else "zotero-mcp"
+_HOME = Path.home()
+_APPDATA = os.environ.get("APPDATA", "")
+_XDG_CONFIG_HOME = Path(os.environ.get("XDG_CONFIG_HOME") or (_HOME / ".config"))
+
+# Candidate paths below are plain strings (os.path) and only become Path
+# objects when returned to callers.
+_HOME_DIR = str(_HOME)
+
+if _PLATFORM == "darwin":  # macOS
+    _CLAUDE_CONFIG_BASE = os.path.join(_HOME_DIR, "Library", "Application Support")
+elif _PLATFORM == "win32":  # Windows
+    _CLAUDE_CONFIG_BASE = _APPDATA
+else:  # Linux and others
+    _CLAUDE_CONFIG_BASE = str(_XDG_CONFIG_HOME)
+
+# Candidates in lookup order; the last one (newer "Claude Desktop" path)
+# doubles as the default when none exist.
+_CLAUDE_CONFIG_CANDIDATES = (
+    os.path.join(_CLAUDE_CONFIG_BASE, "Claude", "claude_desktop_config.json"),
+    os.path.join(_CLAUDE_CONFIG_BASE, "Claude Desktop", "claude_desktop_config.json"),
+)
+
+# Directories probed for the executable when it isn't on PATH: the
+# interpreter and user-install scripts directories, ~/.local/bin, and
+# Homebrew/system prefixes on macOS
+_BIN_DIRS = (
+    sysconfig.get_path("scripts"),
+    sysconfig.get_path("scripts", sysconfig.get_preferred_scheme("user")),
+    os.path.join(_HOME_DIR, ".local", "bin"),
+)
+if _PLATFORM == "darwin":  # macOS
+    _BIN_DIRS += ("/usr/local/bin", "/opt/homebrew/bin")
+_EXE_CANDIDATES = tuple(os.path.join(bin_dir, _EXE_NAME) for bin_dir in _BIN_DIRS)
+
+# User bin directories scanned (one level deep) as a last resort
+_FALLBACK_BIN_DIRS = (
+    os.path.join(_HOME_DIR, ".pyenv", "shims"),
+    os.path.join(_HOME_DIR, "miniconda3", "bin"),
+    os.path.join(_HOME_DIR, "anaconda3", "bin"),
+    os.path.join(_HOME_DIR, "miniforge3", "bin"),
+)
+
+# Central zotero-mcp config directory
+_ZOTERO_MCP_CONFIG_DIR = _HOME / ".config" / "zotero-mcp"
+
+# Executable lookups keyed by (exe_name, PATH) so repeated calls skip the scan
+_exe_cache: dict[tuple[str, str], str | None] = {}
+
+# Per-run stat results keyed by path string (None for missing paths); cleared
+# at the start of main() and invalidated for files written here
+_stat_cache: dict[str, os.stat_result | None] = {}
+
+
+def _stat_cached(path) -> os.stat_result | None:
+    """Return os.stat(path), or None if it doesn't exist, caching the result."""
+    key = os.fspath(path)
+    if key not in _stat_cache:
+        try:
+            _stat_cache[key] = os.stat(key)
+        except OSError:
+            _stat_cache[key] = None
+    return _stat_cache[key]
+
+
+def _exists_cached(path) -> bool:
+    """Return whether path exists, using the per-run stat cache."""
+    return _stat_cached(path) is not None
+
+
+# Directories already created (or found) during this setup run
+_dirs_ensured: set[str] = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create path (and parents) once per setup run."""
+    key = os.fspath(path)
+    if key not in _dirs_ensured:
+        path.mkdir(parents=True, exist_ok=True)
+        _dirs_ensured.add(key)
+
+
+def _canon(config) -> bytes:
+    """Return a digest of config's canonical JSON form, for cheap equality checks."""
+    data = json.dumps(config, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _write_json_atomic(path: Path, obj) -> bool:
+    """
+    Write obj as indented JSON to path atomically.
+
+    The payload is serialized up front, written to a temporary file in the
+    same directory with a single write, fsynced, and moved over path. Nothing
+    is written when path already holds exactly these bytes. A symlinked path
+    is resolved first so the link's target is replaced, not the link, and an
+    existing file keeps its permission bits.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    data = json_dumps(obj, indent=True).encode("utf-8")
+    target = Path(os.path.realpath(path))
+    old = _stat_cached(target)
+    if old is not None:
+        try:
+            if target.read_bytes() == data:
+                return False
+        except OSError:
+            pass
+    tmp = tempfile.NamedTemporaryFile("wb", dir=target.parent, prefix=f".{target.name}.", delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        if old is not None:
+            os.chmod(tmp.name, stat.S_IMODE(old.st_mode))
+        os.replace(tmp.name, target)
+        _stat_cache.pop(os.fspath(path), None)
+        _stat_cache.pop(os.fspath(target), None)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+    return True
 
 
 def find_executable():
     """Find the full path to the zotero-mcp executable."""
-    # Try to find the executable in the PATH
-    exe_name = "zotero-mcp"
-    if sys.platform == "win32":
-        exe_name += ".exe"
+    key = (_EXE_NAME, os.environ.get("PATH", ""))
+    if key not in _exe_cache:
+        _exe_cache[key] = _find_executable_uncached()
+    return _exe_cache[key]
+
+
+def _find_executable_uncached() -> str | None:
+    """Locate the zotero-mcp executable on PATH or in common installation directories."""
+    import shutil
 
-    exe_path = shutil.which(exe_name)
+    # Try to find the executable in the PATH
+    exe_path = shutil.which(_EXE_NAME)
     if exe_path:
         print(f"Found zotero-mcp in PATH at: {exe_path}")
         return exe_path
 
     # If not found in PATH, try to find it in common installation directories
-    potential_paths = []
-
-    # User site-packages
-    import site
-    for site_path in site.getsitepackages():
-        potential_paths.append(Path(site_path) / "bin" / exe_name)
-
-    # User's home directory
-    potential_paths.append(Path.home() / ".local" / "bin" / exe_name)
-
-    # Virtual environment
+    candidates = _EXE_CANDIDATES
     if "VIRTUAL_ENV" in os.environ:
-        potential_paths.append(Path(os.environ["VIRTUAL_ENV"]) / "bin" / exe_name)
-
-    # Additional common locations
-    if sys.platform == "darwin":  # macOS
-        potential_paths.append(Path("/usr/local/bin") / exe_name)
-        potential_paths.append(Path("/opt/homebrew/bin") / exe_name)
+        candidates += (os.path.join(os.environ["VIRTUAL_ENV"], "bin", _EXE_NAME),)
 
-    for path in potential_paths:
-        if path.exists() and os.access(path, os.X_OK):
+    for path in candidates:
+        st = _stat_cached(path)
+        if st is not None and stat.S_ISREG(st.st_mode) and st.st_mode & 0o111:
             print(f"Found zotero-mcp at: {path}")
-            return str(path)
+            return path
 
-    # If still not found, search in common directories
+    # If still not found, look (non-recursively) in common user bin directories
     print("Searching for zotero-mcp in common locations...")
-    try:
-        # On Unix-like systems, try using the 'find' command
-        if sys.platform != 'win32':
-            import subprocess
-            result = subprocess.run(
-                ["find", os.path.expanduser("~"), "-name", "zotero-mcp", "-type", "f", "-executable"],
-                capture_output=True, text=True, timeout=10
-            )
-            paths = result.stdout.strip().split('\n')
-            if paths and paths[0]:
-                print(f"Found zotero-mcp at {paths[0]}")
-                return paths[0]
-    except Exception as e:
-        print(f"Error searching for zotero-mcp: {e}")
+    search_dirs = (*_FALLBACK_BIN_DIRS, *glob.glob(os.path.join(_HOME_DIR, "Library", "Python", "*", "bin")))
+    for search_dir in search_dirs:
+        try:
+            with os.scandir(search_dir) as entries:
+                for entry in entries:
+                    if entry.name == _EXE_NAME and entry.is_file() and os.access(entry.path, os.X_OK):
+                        print(f"Found zotero-mcp at {entry.path}")
+                        return entry.path
+        except OSError:
+            continue
 
     print("Warning: Could not find zotero-mcp executable.")
     print("Make sure zotero-mcp is installed and in your PATH.")
@@ -77,47 +201,69 @@ def find_executable():
 
 def find_claude_config():
     """Find Claude Desktop config file path."""
-    config_paths = []
-
-    # macOS
-    if sys.platform == "darwin":
-        # Try both old and new paths
-        config_paths.append(Path.home() / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json")
-        config_paths.append(Path.home() / "Library" / "Application Support" / "Claude Desktop" / "claude_desktop_config.json")
-
-    # Windows
-    elif sys.platform == "win32":
-        appdata = os.environ.get("APPDATA")
-        if appdata:
-            config_paths.append(Path(appdata) / "Claude" / "claude_desktop_config.json")
-            config_paths.append(Path(appdata) / "Claude Desktop" / "claude_desktop_config.json")
-
-    # Linux
-    else:
-        config_home = os.environ.get('XDG_CONFIG_HOME', Path.home() / '.config')
-        config_paths.append(Path(config_home) / "Claude" / "claude_desktop_config.json")
-        config_paths.append(Path(config_home) / "Claude Desktop" / "claude_desktop_config.json")
+    # One listing of the shared base directory tells us which Claude
+    # directories exist; only those candidates need a stat
+    try:
+        with os.scandir(_CLAUDE_CONFIG_BASE) as entries:
+            present = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        present = None
 
     # Check all possible locations
-    for path in config_paths:
-        if path.exists():
+    for path in _CLAUDE_CONFIG_CANDIDATES:
+        if present is not None and os.path.basename(os.path.dirname(path)) not in present:
+            continue
+        if _exists_cached(path):
             print(f"Found Claude Desktop config at: {path}")
-            return path
-
-    # Return the default path for the platform if not found
-    # We'll use the newer "Claude Desktop" path as default
-    if sys.platform == "darwin":  # macOS
-        default_path = Path.home() / "Library" / "Application Support" / "Claude Desktop" / "claude_desktop_config.json"
-    elif sys.platform == "win32":  # Windows
-        appdata = os.environ.get("APPDATA", "")
-        default_path = Path(appdata) / "Claude Desktop" / "claude_desktop_config.json"
-    else:  # Linux and others
-        config_home = os.environ.get('XDG_CONFIG_HOME', Path.home() / '.config')
-        default_path = Path(config_home) / "Claude Desktop" / "claude_desktop_config.json"
+            return Path(path)
 
+    default_path = Path(_CLAUDE_CONFIG_CANDIDATES[-1])
     print(f"Claude Desktop config not found. Using default path: {default_path}")
     return default_path
 
+# getpass module, imported on first use
+_getpass_mod = None
+
+
+def _getpass(prompt: str) -> str:
+    """Read a secret without echo, importing getpass only once."""
+    global _getpass_mod
+    if _getpass_mod is None:
+        import getpass
+        _getpass_mod = getpass
+    return _getpass_mod.getpass(prompt)
+
+
+# Env vars (API key, model name, base URL) per API-backed embedding provider
+_EMBED_ENV = MappingProxyType({
+    "openai": ("OPENAI_API_KEY", "OPENAI_EMBEDDING_MODEL", "OPENAI_BASE_URL"),
+    "gemini": ("GEMINI_API_KEY", "GEMINI_EMBEDDING_MODEL", "GEMINI_BASE_URL"),
+    "mistral": ("MISTRAL_API_KEY", "MISTRAL_EMBEDDING_MODEL", "MISTRAL_BASE_URL"),
+})
+
+# Model names offered by the provider sub-menus, keyed by menu choice
+_EMBEDDING_MODEL_NAMES = MappingProxyType({
+    "openai": MappingProxyType({"1": "text-embedding-3-small", "2": "text-embedding-3-large"}),
+    "gemini": MappingProxyType({"1": "models/text-embedding-004", "2": "models/gemini-embedding-exp-03-07"}),
+})
+
+# Valid answers for the numbered setup menus
+_CHOICES_12 = frozenset({"1", "2"})
+_CHOICES_1234 = frozenset({"1", "2", "3", "4"})
+
+
+def _prompt_choice(prompt: str, valid: frozenset[str]) -> str:
+    """Prompt until the stripped answer is one of valid, and return it."""
+    options = sorted(valid)
+    if len(options) == 2:
+        hint = f"Please enter {options[0]} or {options[1]}"
+    else:
+        hint = f"Please enter {', '.join(options[:-1])}, or {options[-1]}"
+    while (choice := input(prompt).strip()) not in valid:
+        print(hint)
+    return choice
+
+
 def setup_semantic_search(existing_semantic_config: dict = None, semantic_config_only_arg: bool = False) -> dict:
     """Interactive setup for semantic search configuration."""
     print("\n=== Semantic Search Configuration ===")
@@ -148,11 +294,7 @@ def setup_semantic_search(existing_semantic_config: dict = None, semantic_config
     print("3. Gemini - Better quality, requires API key")
     print("4. Mistral - High quality, requires API key")
 
-    while True:
-        choice = input("\nChoose embedding model (1-4): ").strip()
-        if choice in ["1", "2", "3", "4"]:
-            break
-        print("Please enter 1, 2, 3, or 4")
+    choice = _prompt_choice("\nChoose embedding model (1-4): ", _CHOICES_1234)
 
     config = {}
 
@@ -168,19 +310,12 @@ def setup_semantic_search(existing_semantic_config: dict = None, semantic_config
         print("1. text-embedding-3-small (recommended, faster)")
         print("2. text-embedding-3-large (higher quality, slower)")
 
-        while True:
-            model_choice = input("Choose OpenAI model (1-2): ").strip()
-            if model_choice in ["1", "2"]:
-                break
-            print("Please enter 1 or 2")
+        model_choice = _prompt_choice("Choose OpenAI model (1-2): ", _CHOICES_12)
 
-        if model_choice == "1":
-            config["embedding_config"] = {"model_name": "text-embedding-3-small"}
-        else:
-            config["embedding_config"] = {"model_name": "text-embedding-3-large"}
+        config["embedding_config"] = {"model_name": _EMBEDDING_MODEL_NAMES["openai"][model_choice]}
 
         # Get API key
-        api_key = getpass.getpass("Enter your OpenAI API key (hidden): ").strip()
+        api_key = _getpass("Enter your OpenAI API key (hidden): ").strip()
         if api_key:
             config["embedding_config"]["api_key"] = api_key
         else:
@@ -202,19 +337,12 @@ def setup_semantic_search(existing_semantic_config: dict = None, semantic_config
         print("1. models/text-embedding-004 (recommended)")
         print("2. models/gemini-embedding-exp-03-07 (experimental)")
 
-        while True:
-            model_choice = input("Choose Gemini model (1-2): ").strip()
-            if model_choice in ["1", "2"]:
-                break
-            print("Please enter 1 or 2")
+        model_choice = _prompt_choice("Choose Gemini model (1-2): ", _CHOICES_12)
 
-        if model_choice == "1":
-            config["embedding_config"] = {"model_name": "models/text-embedding-004"}
-        else:
-            config["embedding_config"] = {"model_name": "models/gemini-embedding-exp-03-07"}
+        config["embedding_config"] = {"model_name": _EMBEDDING_MODEL_NAMES["gemini"][model_choice]}
 
         # Get API key
-        api_key = getpass.getpass("Enter your Gemini API key (hidden): ").strip()
+        api_key = _getpass("Enter your Gemini API key (hidden): ").strip()
         if api_key:
             config["embedding_config"]["api_key"] = api_key
         else:
@@ -233,7 +361,7 @@ def setup_semantic_search(existing_semantic_config: dict = None, semantic_config
         config["embedding_config"] = {"model_name": "mistral-embed"}
 
         # Get API key
-        api_key = getpass.getpass("Enter your Mistral API key (hidden): ").strip()
+        api_key = _getpass("Enter your Mistral API key (hidden): ").strip()
         if api_key:
             config["embedding_config"]["api_key"] = api_key
         else:
@@ -255,11 +383,7 @@ def setup_semantic_search(existing_semantic_config: dict = None, semantic_config
     print("3. Daily - Automatically update once per day")
     print("4. Every N days - Automatically update every N days")
 
-    while True:
-        update_choice = input("\nChoose update frequency (1-4): ").strip()
-        if update_choice in ["1", "2", "3", "4"]:
-            break
-        print("Please enter 1, 2, 3, or 4")
+    update_choice = _prompt_choice("\nChoose update frequency (1-4): ", _CHOICES_1234)
 
     update_config = {}
 
@@ -352,24 +476,32 @@ def save_semantic_search_config(config: dict, semantic_config_path: Path) -> boo
     """Save semantic search configuration to file."""
     try:
         # Ensure config directory exists
-        semantic_config_dir = semantic_config_path.parent
-        semantic_config_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(semantic_config_path.parent)
 
-        # Load existing config or create new one
+        # First run: nothing to merge with, write the new config directly
+        if not _exists_cached(semantic_config_path):
+            _write_json_atomic(semantic_config_path, {"semantic_search": config})
+            print(f"Semantic search configuration saved to: {semantic_config_path}")
+            return True
+
+        # Load existing config to merge into
         full_semantic_config = {}
-        if semantic_config_path.exists():
-            try:
-                with open(semantic_config_path) as f:
-                    full_semantic_config = json.load(f)
-            except json.JSONDecodeError:
-                print("Warning: Existing semantic search config file is invalid JSON, creating new one")
+        try:
+            with open(semantic_config_path, encoding="utf-8") as f:
+                full_semantic_config = json_loads(f.read())
+        except json.JSONDecodeError:
+            print("Warning: Existing semantic search config file is invalid JSON, creating new one")
+
+        # Nothing to write if the stored semantic search config already matches
+        if _canon(full_semantic_config.get("semantic_search")) == _canon(config):
+            print(f"Semantic search configuration already up to date in: {semantic_config_path}")
+            return True
 
         # Add semantic search config
         full_semantic_config["semantic_search"] = config
 
         # Write config
-        with open(semantic_config_path, 'w') as f:
-            json.dump(full_semantic_config, f, indent=2)
+        _write_json_atomic(semantic_config_path, full_semantic_config)
 
         print(f"Semantic search configuration saved to: {semantic_config_path}")
         return True
@@ -380,12 +512,12 @@ def save_semantic_search_config(config: dict, semantic_config_path: Path) -> boo
 
 def load_semantic_search_config(semantic_config_path: Path) -> dict:
     """Load existing semantic search configuration."""
-    if not semantic_config_path.exists():
+    if not _exists_cached(semantic_config_path):
         return {}
 
     try:
-        with open(semantic_config_path) as f:
-            full_semantic_config = json.load(f)
+        with open(semantic_config_path, encoding="utf-8") as f:
+            full_semantic_config = json_loads(f.read())
         return full_semantic_config.get("semantic_search", {})
     except json.JSONDecodeError as e:
         print(f"Warning: Could not parse config file as JSON: {e}")
@@ -395,33 +527,16 @@ def load_semantic_search_config(semantic_config_path: Path) -> dict:
         return {}
 
 
-def update_claude_config(config_path, zotero_mcp_path, local=True, api_key=None, library_id=None, library_type="user", semantic_config=None):
-    """Update Claude Desktop config to add zotero-mcp."""
-    # Create directory if it doesn't exist
-    config_dir = config_path.parent
-    config_dir.mkdir(parents=True, exist_ok=True)
-
-    # Load existing config or create new one
-    if config_path.exists():
-        try:
-            with open(config_path) as f:
-                config = json.load(f)
-            print(f"Loaded existing config from: {config_path}")
-        except json.JSONDecodeError:
-            print(f"Error: Config file at {config_path} is not valid JSON. Creating new config.")
-            config = {}
-    else:
-        print(f"Creating new config file at: {config_path}")
-        config = {}
-
-    # Ensure mcpServers key exists
-    if "mcpServers" not in config:
-        config["mcpServers"] = {}
-
+def _build_env_settings(local: bool, api_key: str = None, library_id: str = None, library_type: str = "user",
+                        semantic_config: dict = None, no_claude: bool = False) -> dict:
+    """Build the zotero-mcp environment variables for a client config."""
     # Create environment settings based on local vs web API
     env_settings = {
         "ZOTERO_LOCAL": "true" if local else "false"
     }
+    # Persist global guard to disable Claude detection/output if requested
+    if no_claude:
+        env_settings["ZOTERO_NO_CLAUDE"] = "true"
 
     # Add API key and library settings for web API
     if not local:
@@ -437,29 +552,37 @@ def update_claude_config(config_path, zotero_mcp_path, local=True, api_key=None,
         env_settings["ZOTERO_EMBEDDING_MODEL"] = semantic_config.get("embedding_model", "default")
 
         embedding_config = semantic_config.get("embedding_config", {})
-        if semantic_config.get("embedding_model") == "openai":
-            if api_key := embedding_config.get("api_key"):
-                env_settings["OPENAI_API_KEY"] = api_key
-            if model := embedding_config.get("model_name"):
-                env_settings["OPENAI_EMBEDDING_MODEL"] = model
-            if base_url := embedding_config.get("base_url"):
-                env_settings["OPENAI_BASE_URL"] = base_url
-
-        elif semantic_config.get("embedding_model") == "gemini":
-            if api_key := embedding_config.get("api_key"):
-                env_settings["GEMINI_API_KEY"] = api_key
-            if model := embedding_config.get("model_name"):
-                env_settings["GEMINI_EMBEDDING_MODEL"] = model
-            if base_url := embedding_config.get("base_url"):
-                env_settings["GEMINI_BASE_URL"] = base_url
-
-        elif semantic_config.get("embedding_model") == "mistral":
-            if api_key := embedding_config.get("api_key"):
-                env_settings["MISTRAL_API_KEY"] = api_key
-            if model := embedding_config.get("model_name"):
-                env_settings["MISTRAL_EMBEDDING_MODEL"] = model
-            if base_url := embedding_config.get("base_url"):
-                env_settings["MISTRAL_BASE_URL"] = base_url
+        if env_keys := _EMBED_ENV.get(semantic_config.get("embedding_model")):
+            for field, env_var in zip(("api_key", "model_name", "base_url"), env_keys):
+                if value := embedding_config.get(field):
+                    env_settings[env_var] = value
+
+    return env_settings
+
+
+def update_claude_config(config_path, zotero_mcp_path, local=True, api_key=None, library_id=None, library_type="user", semantic_config=None):
+    """Update Claude Desktop config to add zotero-mcp."""
+    # Create directory if it doesn't exist
+    _ensure_dir(config_path.parent)
+
+    # Load existing config or create new one
+    if _exists_cached(config_path):
+        try:
+            with open(config_path, encoding="utf-8") as f:
+                config = json_loads(f.read())
+            print(f"Loaded existing config from: {config_path}")
+        except json.JSONDecodeError:
+            print(f"Error: Config file at {config_path} is not valid JSON. Creating new config.")
+            config = {}
+    else:
+        print(f"Creating new config file at: {config_path}")
+        config = {}
+
+    # Ensure mcpServers key exists
+    if "mcpServers" not in config:
+        config["mcpServers"] = {}
+
+    env_settings = _build_env_settings(local, api_key, library_id, library_type, semantic_config)
 
     # Add or update zotero config
     config["mcpServers"]["zotero"] = {
@@ -469,9 +592,10 @@ def update_claude_config(config_path, zotero_mcp_path, local=True, api_key=None,
 
     # Write updated config
     try:
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
-        print(f"\nSuccessfully wrote config to: {config_path}")
+        if _write_json_atomic(config_path, config):
+            print(f"\nSuccessfully wrote config to: {config_path}")
+        else:
+            print(f"\nConfig already up to date at: {config_path}")
     except Exception as e:
         print(f"Error writing config file: {str(e)}")
         return False
@@ -479,18 +603,22 @@ def update_claude_config(config_path, zotero_mcp_path, local=True, api_key=None,
     return config_path
 
 
-def _write_standalone_config(local: bool, api_key: str, library_id: str, library_type: str, semantic_config: dict, no_claude: bool = False) -> Path:
-    """Write a central config file used by semantic search and provide client env."""
-    cfg_dir = Path.home() / ".config" / "zotero-mcp"
-    cfg_dir.mkdir(parents=True, exist_ok=True)
-    cfg_path = cfg_dir / "config.json"
+def _write_standalone_config(local: bool, api_key: str, library_id: str, library_type: str, semantic_config: dict, no_claude: bool = False) -> tuple[Path, dict]:
+    """
+    Write a central config file used by semantic search and provide client env.
+
+    Returns:
+        Tuple of the config file path and the client env written to it.
+    """
+    _ensure_dir(_ZOTERO_MCP_CONFIG_DIR)
+    cfg_path = _ZOTERO_MCP_CONFIG_DIR / "config.json"
 
     # Load or initialize
     full = {}
-    if cfg_path.exists():
+    if _exists_cached(cfg_path):
         try:
-            with open(cfg_path) as f:
-                full = json.load(f)
+            with open(cfg_path, encoding="utf-8") as f:
+                full = json_loads(f.read())
         except Exception:
             full = {}
 
@@ -499,30 +627,23 @@ def _write_standalone_config(local: bool, api_key: str, library_id: str, library
         full["semantic_search"] = semantic_config
 
     # Provide a helper env section for web-based clients
-    client_env = {
-        "ZOTERO_LOCAL": "true" if local else "false"
-    }
-    # Persist global guard to disable Claude detection/output if requested
-    if no_claude:
-        client_env["ZOTERO_NO_CLAUDE"] = "true"
-    if not local:
-        if api_key:
-            client_env["ZOTERO_API_KEY"] = api_key
-        if library_id:
-            client_env["ZOTERO_LIBRARY_ID"] = library_id
-        if library_type:
-            client_env["ZOTERO_LIBRARY_TYPE"] = library_type
+    client_env = _build_env_settings(local, api_key, library_id, library_type, no_claude=no_claude)
 
     full["client_env"] = client_env
 
-    with open(cfg_path, 'w') as f:
-        json.dump(full, f, indent=2)
+    _write_json_atomic(cfg_path, full)
 
-    return cfg_path
+    return cfg_path, client_env
 
 
 def main(cli_args=None):
     """Main function to run the setup helper."""
+    # Start from fresh stat results so files created since the last run are seen
+    _stat_cache.clear()
+    _dirs_ensured.clear()
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="Configure zotero-mcp for Claude Desktop")
     parser.add_argument("--no-local", action="store_true", help="Configure for Zotero Web API instead of local API")
     parser.add_argument("--no-claude", action="store_true", help="Don't setup Claude Desktop config: instead store settings in config file.")
@@ -546,7 +667,7 @@ def main(cli_args=None):
         print("Parsed arguments from command line")
 
     # Determine config path for semantic search
-    semantic_config_dir = Path.home() / ".config" / "zotero-mcp"
+    semantic_config_dir = _ZOTERO_MCP_CONFIG_DIR
     semantic_config_path = semantic_config_dir / "config.json"
     existing_semantic_config = load_semantic_search_config(semantic_config_path)
     semantic_config_changed = False
@@ -555,7 +676,7 @@ def main(cli_args=None):
     if args.semantic_config_only:
         print("Configuring semantic search only...")
         new_semantic_config = setup_semantic_search(existing_semantic_config)
-        semantic_config_changed = existing_semantic_config != new_semantic_config
+        semantic_config_changed = _canon(existing_semantic_config) != _canon(new_semantic_config)
         # only save if semantic config changed
         if semantic_config_changed:
             if save_semantic_search_config(new_semantic_config, semantic_config_path):
@@ -608,17 +729,21 @@ def main(cli_args=None):
         # Either way:
         if input().strip().lower() in ['y', 'yes']:
             new_semantic_config = setup_semantic_search(existing_semantic_config)
-            if existing_semantic_config != new_semantic_config:
+            if _canon(existing_semantic_config) != _canon(new_semantic_config):
                 semantic_config_changed = True
                 existing_semantic_config = new_semantic_config  # Update the config to use
                 save_semantic_search_config(existing_semantic_config, semantic_config_path)
 
-    print("\nSetup with the following settings:")
-    print(f"  Local API: {use_local}")
-    if not use_local:
-        print(f"  API Key: {api_key or 'Not provided'}")
-        print(f"  Library ID: {library_id or 'Not provided'}")
-        print(f"  Library Type: {library_type}")
+    quiet = os.environ.get("ZOTERO_MCP_QUIET") == "1"
+    if not quiet:
+        lines = ["\nSetup with the following settings:", f"  Local API: {use_local}"]
+        if not use_local:
+            lines += [
+                f"  API Key: {api_key or 'Not provided'}",
+                f"  Library ID: {library_id or 'Not provided'}",
+                f"  Library Type: {library_type}",
+            ]
+        print("\n".join(lines))
 
     # Use the potentially updated semantic config
     semantic_config = existing_semantic_config
@@ -626,7 +751,7 @@ def main(cli_args=None):
     # Update configuration based on mode
     try:
         if args.no_claude:
-            cfg_path = _write_standalone_config(
+            cfg_path, client_env = _write_standalone_config(
                 local=use_local,
                 api_key=api_key,
                 library_id=library_id,
@@ -637,14 +762,8 @@ def main(cli_args=None):
             print("\nSetup complete (standalone/web mode)!")
             print(f"Config saved to: {cfg_path}")
             # Emit one-line client_env for easy copy/paste
-            try:
-                with open(cfg_path) as f:
-                    full = json.load(f)
-                env_line = json.dumps(full.get("client_env", {}), separators=(',', ':'))
-                print("Client environment (single-line JSON):")
-                print(env_line)
-            except Exception:
-                pass
+            print("Client environment (single-line JSON):")
+            print(json_dumps(client_env))
             if semantic_config_changed:
                 print("\nNote: You changed semantic search settings. Consider rebuilding the DB:")
                 print("  zotero-mcp update-db --force-rebuild")
@@ -660,23 +779,30 @@ def main(cli_args=None):
                 semantic_config=semantic_config
             )
             if updated_config_path:
-                print("\nSetup complete!")
-                print("To use Zotero in Claude Desktop:")
-                print("1. Restart Claude Desktop if it's running")
-                print("2. In Claude, type: /tools zotero")
-                if semantic_config_changed:
-                    print("\nSemantic Search:")
-                    print("- Configured with", semantic_config.get("embedding_model", "default"), "embedding model")
-                    print("- To change the configuration, run: zotero-mcp setup --semantic-config-only")
-                    print("- The config file is located at: ~/.config/zotero-mcp/config.json")
-                    print("- You may need to rebuild your database: zotero-mcp update-db --force-rebuild")
-                else:
-                    print("\nSemantic Search:")
-                    print("- To update the database, run: zotero-mcp update-db")
-                    print("- Use zotero_semantic_search tool in Claude for AI-powered search")
-                if use_local:
-                    print("\nNote: Make sure Zotero desktop is running and the local API is enabled in preferences.")
-                else:
+                lines = ["\nSetup complete!"]
+                if not quiet:
+                    lines += [
+                        "To use Zotero in Claude Desktop:",
+                        "1. Restart Claude Desktop if it's running",
+                        "2. In Claude, type: /tools zotero",
+                        "\nSemantic Search:",
+                    ]
+                    if semantic_config_changed:
+                        lines += [
+                            f"- Configured with {semantic_config.get('embedding_model', 'default')} embedding model",
+                            "- To change the configuration, run: zotero-mcp setup --semantic-config-only",
+                            "- The config file is located at: ~/.config/zotero-mcp/config.json",
+                            "- You may need to rebuild your database: zotero-mcp update-db --force-rebuild",
+                        ]
+                    else:
+                        lines += [
+                            "- To update the database, run: zotero-mcp update-db",
+                            "- Use zotero_semantic_search tool in Claude for AI-powered search",
+                        ]
+                    if use_local:
+                        lines.append("\nNote: Make sure Zotero desktop is running and the local API is enabled in preferences.")
+                print("\n".join(lines))
+                if not use_local:
                     missing = []
                     if not api_key:
                         missing.append("API key")
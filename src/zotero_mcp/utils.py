@@ -1,45 +1,190 @@
-from typing import List, Dict
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, List, Dict
+import html
+import json
 import os
 import re
+import threading
+import time
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # optional speedup
+    HTMLParser = None
+
+# Inputs at least this long are handed to selectolax when it is installed
+_CLEAN_HTML_PARSER_MIN = 2048
 
 html_re = re.compile(r"<.*?>")
+citation_key_re = re.compile(r"^[ \t]*citation[ \t]*key[ \t]*:[ \t]*(\S[^\r\n]*?)[ \t\r]*$", re.IGNORECASE | re.MULTILINE)
+
+# Common spellings of truthy env values; anything else falls back to .lower()
+_TRUTHY = frozenset({"true", "True", "TRUE", "yes", "Yes", "YES", "1"})
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed time.
+
+    Args:
+        maxsize: Maximum number of entries; the least recently used is evicted.
+        ttl: Seconds an entry stays valid after it is stored.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires, value = entry
+            if expires < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """
+    Serialize an object to a JSON string, using orjson when it is installed.
+
+    Args:
+        obj: JSON-serializable object.
+        indent: Pretty-print with a two-space indent instead of compact output.
+
+    Returns:
+        JSON string.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    if indent:
+        return json.dumps(obj, indent=2)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def json_loads(data: str | bytes) -> Any:
+    """
+    Parse a JSON string, using orjson when it is installed.
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON (orjson's error
+            type subclasses it).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def format_creators(creators: list[dict[str, str]]) -> str:
     """
     Format creator names into a string.
 
+    Results are cached on the names involved, since the same creator lists
+    come back again and again across searches and listings.
+
     Args:
         creators: List of creator objects from Zotero.
 
     Returns:
         Formatted string with creator names.
     """
+    return _format_creator_names(
+        tuple((c.get("firstName"), c.get("lastName"), c.get("name")) for c in creators)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _format_creator_names(names_key: tuple[tuple[str | None, str | None, str | None], ...]) -> str:
+    """Format (firstName, lastName, name) tuples; None marks a missing field."""
     names = []
-    for creator in creators:
-        if "firstName" in creator and "lastName" in creator:
-            names.append(f"{creator['lastName']}, {creator['firstName']}")
-        elif "name" in creator:
-            names.append(creator["name"])
+    for first_name, last_name, name in names_key:
+        if first_name is not None and last_name is not None:
+            names.append(f"{last_name}, {first_name}")
+        elif name is not None:
+            names.append(name)
     return "; ".join(names) if names else "No authors listed"
 
 
+@lru_cache(maxsize=1)
 def is_local_mode() -> bool:
     """Return True if running in local mode.
 
     Local mode is enabled when environment variable `ZOTERO_LOCAL` is set to a
-    truthy value ("true", "yes", or "1", case-insensitive).
+    truthy value ("true", "yes", or "1", case-insensitive). The result is
+    cached; call `is_local_mode.cache_clear()` after changing `ZOTERO_LOCAL`
+    at runtime.
     """
-    value = os.getenv("ZOTERO_LOCAL", "")
-    return value.lower() in {"true", "yes", "1"}
+    value = os.environ.get("ZOTERO_LOCAL", "")
+    return value in _TRUTHY or value.lower() in _TRUTHY
 
 def clean_html(raw_html: str) -> str:
     """
     Remove HTML tags from a string.
 
+    Entities such as ``&amp;`` are decoded. Long inputs go through
+    selectolax's C parser when it is installed.
+
     Args:
         raw_html: String containing HTML content.
     Returns:
         Cleaned string without HTML tags.
     """
-    clean_text = re.sub(html_re, "", raw_html)
-    return clean_text
\ No newline at end of file
+    if HTMLParser is not None and len(raw_html) >= _CLEAN_HTML_PARSER_MIN:
+        return HTMLParser(raw_html).text(separator="")
+
+    # Linear scan from each "<" to the next ">"; text outside tags is kept
+    parts = []
+    find = raw_html.find
+    i = 0
+    while (lt := find("<", i)) >= 0:
+        gt = find(">", lt + 1)
+        if gt < 0:
+            break
+        parts.append(raw_html[i:lt])
+        i = gt + 1
+    parts.append(raw_html[i:])
+    return html.unescape("".join(parts))
+
+
+def extract_citation_key(extra: str | None) -> str | None:
+    """
+    Find a citation key line ("Citation Key: ..." or "citationkey: ...") in an Extra field.
+
+    Args:
+        extra: Contents of a Zotero item's Extra field.
+    Returns:
+        The citation key, or None if the field has none.
+    """
+    match = citation_key_re.search(extra) if extra else None
+    return match.group(1) if match else None